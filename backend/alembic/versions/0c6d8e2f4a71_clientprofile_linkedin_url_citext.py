@@ -0,0 +1,35 @@
+"""clientprofile.linkedin_url as indexed citext
+
+Revision ID: 0c6d8e2f4a71
+Revises: f2a7b9c41d05
+Create Date: 2025-06-18 09:12:54.381026
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0c6d8e2f4a71'
+down_revision = 'f2a7b9c41d05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+    op.alter_column('clientprofile', 'linkedin_url',
+               existing_type=sa.VARCHAR(),
+               type_=postgresql.CITEXT(),
+               existing_nullable=True)
+    op.create_index(op.f('ix_clientprofile_linkedin_url'), 'clientprofile', ['linkedin_url'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_clientprofile_linkedin_url'), table_name='clientprofile')
+    op.alter_column('clientprofile', 'linkedin_url',
+               existing_type=postgresql.CITEXT(),
+               type_=sa.VARCHAR(),
+               existing_nullable=True)
+    # The citext extension is left installed; other objects may depend on it
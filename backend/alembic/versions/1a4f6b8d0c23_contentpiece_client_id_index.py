@@ -0,0 +1,37 @@
+"""index contentpiece.client_id
+
+Revision ID: 1a4f6b8d0c23
+Revises: 0c6d8e2f4a71
+Create Date: 2025-06-18 14:37:09.517284
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a4f6b8d0c23'
+down_revision = '0c6d8e2f4a71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_contentpiece_client_id'),
+            'contentpiece',
+            ['client_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_contentpiece_client_id'),
+            table_name='contentpiece',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,28 @@
+"""external TOAST storage for content bodies
+
+Revision ID: 2b7e9d1f5c38
+Revises: 1a4f6b8d0c23
+Create Date: 2025-06-19 10:48:26.093157
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2b7e9d1f5c38'
+down_revision = '1a4f6b8d0c23'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Only affects values written from now on; existing rows keep their
+    # layout until they are updated (or the table is rewritten).
+    op.execute("ALTER TABLE contentpiece ALTER COLUMN content_body SET STORAGE EXTERNAL")
+    op.execute("ALTER TABLE scheduledlinkedinpost ALTER COLUMN content_text SET STORAGE EXTERNAL")
+
+
+def downgrade():
+    op.execute("ALTER TABLE scheduledlinkedinpost ALTER COLUMN content_text SET STORAGE EXTENDED")
+    op.execute("ALTER TABLE contentpiece ALTER COLUMN content_body SET STORAGE EXTENDED")
@@ -0,0 +1,51 @@
+"""BRIN index on scheduledlinkedinpost.created_at
+
+Revision ID: 3c8a0e5b7d94
+Revises: 2b7e9d1f5c38
+Create Date: 2025-06-19 16:03:41.772950
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c8a0e5b7d94'
+down_revision = '2b7e9d1f5c38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_scheduledlinkedinpost_created_at_brin',
+            'scheduledlinkedinpost',
+            ['created_at'],
+            unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            op.f('ix_scheduledlinkedinpost_created_at'),
+            table_name='scheduledlinkedinpost',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_scheduledlinkedinpost_created_at'),
+            'scheduledlinkedinpost',
+            ['created_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_scheduledlinkedinpost_created_at_brin',
+            table_name='scheduledlinkedinpost',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,40 @@
+"""bound linkedin_post_id and index only non-null values
+
+Revision ID: 4d9b1f6c8e02
+Revises: 3c8a0e5b7d94
+Create Date: 2025-06-20 11:27:15.946318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d9b1f6c8e02'
+down_revision = '3c8a0e5b7d94'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column('scheduledlinkedinpost', 'linkedin_post_id',
+               existing_type=sa.VARCHAR(),
+               type_=sa.String(length=128),
+               existing_nullable=True)
+    op.drop_index(op.f('ix_scheduledlinkedinpost_linkedin_post_id'), table_name='scheduledlinkedinpost')
+    op.create_index(
+        'ix_scheduledlinkedinpost_linkedin_post_id',
+        'scheduledlinkedinpost',
+        ['linkedin_post_id'],
+        unique=True,
+        postgresql_where=sa.text('linkedin_post_id IS NOT NULL'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_scheduledlinkedinpost_linkedin_post_id', table_name='scheduledlinkedinpost')
+    op.create_index(op.f('ix_scheduledlinkedinpost_linkedin_post_id'), 'scheduledlinkedinpost', ['linkedin_post_id'], unique=False)
+    op.alter_column('scheduledlinkedinpost', 'linkedin_post_id',
+               existing_type=sa.String(length=128),
+               type_=sa.VARCHAR(),
+               existing_nullable=True)
@@ -0,0 +1,33 @@
+"""scheduledlinkedinpost scheduled_at as timestamptz
+
+Revision ID: 5c1e8f3a9b27
+Revises: a7704c000daf
+Create Date: 2025-06-14 11:02:45.118304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e8f3a9b27'
+down_revision = 'a7704c000daf'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing naive values were always written as UTC
+    op.alter_column('scheduledlinkedinpost', 'scheduled_at',
+               existing_type=sa.DateTime(),
+               type_=sa.DateTime(timezone=True),
+               existing_nullable=False,
+               postgresql_using="scheduled_at AT TIME ZONE 'UTC'")
+
+
+def downgrade():
+    op.alter_column('scheduledlinkedinpost', 'scheduled_at',
+               existing_type=sa.DateTime(timezone=True),
+               type_=sa.DateTime(),
+               existing_nullable=False,
+               postgresql_using="scheduled_at AT TIME ZONE 'UTC'")
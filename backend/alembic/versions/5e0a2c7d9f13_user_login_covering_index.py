@@ -0,0 +1,34 @@
+"""covering index for login lookups by email
+
+Revision ID: 5e0a2c7d9f13
+Revises: 4d9b1f6c8e02
+Create Date: 2025-06-21 09:42:37.508126
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0a2c7d9f13'
+down_revision = '4d9b1f6c8e02'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_login_cover',
+            'user',
+            ['email'],
+            unique=False,
+            postgresql_include=['hashed_password', 'is_active', 'role', 'id'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_login_cover', table_name='user', postgresql_concurrently=True)
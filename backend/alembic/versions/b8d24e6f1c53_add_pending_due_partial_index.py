@@ -0,0 +1,38 @@
+"""add partial index for pending due scheduled posts
+
+Revision ID: b8d24e6f1c53
+Revises: 5c1e8f3a9b27
+Create Date: 2025-06-14 12:20:07.540912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d24e6f1c53'
+down_revision = '5c1e8f3a9b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_scheduledlinkedinpost_pending_due',
+            'scheduledlinkedinpost',
+            ['scheduled_at'],
+            unique=False,
+            postgresql_where=sa.text("status = 'PENDING'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_scheduledlinkedinpost_pending_due',
+            table_name='scheduledlinkedinpost',
+            postgresql_concurrently=True,
+        )
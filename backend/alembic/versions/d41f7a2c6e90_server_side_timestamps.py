@@ -0,0 +1,49 @@
+"""server side created_at/updated_at timestamps
+
+Revision ID: d41f7a2c6e90
+Revises: b8d24e6f1c53
+Create Date: 2025-06-16 09:41:12.873210
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd41f7a2c6e90'
+down_revision = 'b8d24e6f1c53'
+branch_labels = None
+depends_on = None
+
+TABLES = ('user', 'clientprofile', 'strategy', 'contentpiece', 'scheduledlinkedinpost')
+
+
+def upgrade():
+    # Existing naive values were written with datetime.utcnow()
+    for table in TABLES:
+        op.alter_column(table, 'created_at',
+                   existing_type=sa.DateTime(),
+                   type_=sa.DateTime(timezone=True),
+                   existing_nullable=False,
+                   server_default=sa.text('now()'),
+                   postgresql_using="created_at AT TIME ZONE 'UTC'")
+        op.alter_column(table, 'updated_at',
+                   existing_type=sa.DateTime(),
+                   type_=sa.DateTime(timezone=True),
+                   existing_nullable=True,
+                   postgresql_using="updated_at AT TIME ZONE 'UTC'")
+
+
+def downgrade():
+    for table in TABLES:
+        op.alter_column(table, 'updated_at',
+                   existing_type=sa.DateTime(timezone=True),
+                   type_=sa.DateTime(),
+                   existing_nullable=True,
+                   postgresql_using="updated_at AT TIME ZONE 'UTC'")
+        op.alter_column(table, 'created_at',
+                   existing_type=sa.DateTime(timezone=True),
+                   type_=sa.DateTime(),
+                   existing_nullable=False,
+                   server_default=None,
+                   postgresql_using="created_at AT TIME ZONE 'UTC'")
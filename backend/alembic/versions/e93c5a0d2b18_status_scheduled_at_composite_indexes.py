@@ -0,0 +1,46 @@
+"""composite status/scheduled_at indexes
+
+Revision ID: e93c5a0d2b18
+Revises: d41f7a2c6e90
+Create Date: 2025-06-17 10:05:48.219634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e93c5a0d2b18'
+down_revision = 'd41f7a2c6e90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contentpiece_status_scheduled_at',
+            'contentpiece',
+            ['status', 'scheduled_at'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        # Covered by the composite index above / the pending_due partial index
+        op.drop_index(op.f('ix_contentpiece_status'), table_name='contentpiece', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_contentpiece_scheduled_at'), table_name='contentpiece', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_scheduledlinkedinpost_status'), table_name='scheduledlinkedinpost', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_scheduledlinkedinpost_scheduled_at'), table_name='scheduledlinkedinpost', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_scheduledlinkedinpost_scheduled_at'), 'scheduledlinkedinpost', ['scheduled_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_scheduledlinkedinpost_status'), 'scheduledlinkedinpost', ['status'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_contentpiece_scheduled_at'), 'contentpiece', ['scheduled_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_contentpiece_status'), 'contentpiece', ['status'], unique=False, postgresql_concurrently=True)
+        op.drop_index(
+            'ix_contentpiece_status_scheduled_at',
+            table_name='contentpiece',
+            postgresql_concurrently=True,
+        )
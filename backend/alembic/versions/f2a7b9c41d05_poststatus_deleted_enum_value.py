@@ -0,0 +1,42 @@
+"""add DELETED to the poststatus enum
+
+Revision ID: f2a7b9c41d05
+Revises: e93c5a0d2b18
+Create Date: 2025-06-17 15:22:31.604817
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a7b9c41d05'
+down_revision = 'e93c5a0d2b18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # ALTER TYPE ... ADD VALUE cannot run inside a transaction block before PostgreSQL 12
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TYPE poststatus ADD VALUE IF NOT EXISTS 'DELETED'")
+
+
+def downgrade():
+    # PostgreSQL cannot drop a value from an enum type; rebuild it without DELETED
+    op.execute("UPDATE scheduledlinkedinpost SET status = 'FAILED' WHERE status = 'DELETED'")
+    op.execute("ALTER TYPE poststatus RENAME TO poststatus_old")
+    op.execute("CREATE TYPE poststatus AS ENUM ('PENDING', 'PUBLISHED', 'FAILED')")
+    op.execute("DROP INDEX IF EXISTS ix_scheduledlinkedinpost_pending_due")
+    op.execute(
+        "ALTER TABLE scheduledlinkedinpost ALTER COLUMN status TYPE poststatus "
+        "USING status::text::poststatus"
+    )
+    op.execute("DROP TYPE poststatus_old")
+    op.create_index(
+        'ix_scheduledlinkedinpost_pending_due',
+        'scheduledlinkedinpost',
+        ['scheduled_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
@@ -3,7 +3,7 @@ API dependencies module.
 
 This module contains dependencies for FastAPI endpoints.
 """
-from typing import Generator, Optional
+from typing import Generator
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -44,24 +44,10 @@ def get_current_user(
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=["HS256"]
         )
-        token_data = TokenPayload(**payload)
-        
-        # Check if token is expired
-        if token_data.exp is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        # Get user ID from token
-        user_id: Optional[int] = token_data.sub
-        if user_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # Missing or non-integer sub/exp raise ValidationError (handled below);
+        # jose has already rejected expired tokens
+        token_data = TokenPayload.model_validate(payload)
+        user_id = token_data.sub
             
         # Get user from database
         user = session.exec(select(User).where(User.id == user_id)).first()
@@ -128,7 +114,9 @@ def get_current_admin_user(
     Raises:
         HTTPException: If the user is not an admin
     """
-    if current_user.role != UserRole.ADMIN:
+    # current_user is loaded from the database, so role is a UserRole member
+    # and an identity check is enough
+    if current_user.role is not UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
@@ -152,7 +140,7 @@ def get_current_client_user(
     """
     Get the current client user with client_id.
     """
-    if current_user.role != UserRole.CLIENT:
+    if current_user.role is not UserRole.CLIENT:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
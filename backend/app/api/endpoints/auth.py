@@ -6,7 +6,7 @@ This module contains endpoints for user authentication.
 from datetime import datetime, timedelta, timezone # Added timezone
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlmodel import Session, select
 
@@ -15,6 +15,7 @@ from app.core.config import settings
 from app.core.database import get_session
 from app.core.security import create_access_token, verify_password
 from app.models.user import User, UserRead # Import UserRead
+from app.schemas import USER_READ_ADAPTER
 from app.schemas.token import Token
 
 router = APIRouter()
@@ -91,7 +92,9 @@ def test_token(
         UserRead: User information including linkedin_id
     """
     # The current_user object obtained from get_current_user already contains
-    # all fields, including linkedin_id. We just need to return it.
-    # Pydantic/FastAPI will automatically handle converting the User model
-    # instance to the UserRead response model.
-    return current_user
+    # all fields, including linkedin_id. It is dumped straight to JSON, as in
+    # the users endpoints; the response_model above only documents the shape.
+    return Response(
+        USER_READ_ADAPTER.dump_json(UserRead.from_orm_fast(current_user)),
+        media_type="application/json",
+    )
@@ -33,7 +33,7 @@ def read_clients(
     clients = crud.get_clients(
         session, skip=skip, limit=limit, active_only=active_only
     )
-    return clients
+    return ClientProfileRead.from_rows(clients)
 
 
 @router.post("/", response_model=ClientProfileRead)
@@ -95,7 +95,7 @@ def read_client(
             detail="Not enough permissions",
         )
     
-    return client
+    return ClientProfileRead.from_orm_fast(client)
 
 
 @router.put("/{client_id}", response_model=ClientProfileRead)
@@ -6,10 +6,9 @@ This module contains endpoints for content piece management.
 from typing import Any, List, Optional
 from datetime import datetime, timezone, timedelta
 import os
-import requests
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Form, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Body, Form, File, UploadFile, Response
 from sqlmodel import Session
 
 # Import crud functions directly for clarity
@@ -23,9 +22,11 @@ from app.models.content import (
     ContentStatus,
 )
 from app.crud.content import ContentRatingInput
+from app.models import _msgspec
 from app.models.user import User, UserRole
 from app.models.scheduled_post import ScheduledLinkedInPostCreate, PostStatus
 from app.core.security import decrypt_data
+from app.services import linkedin_http
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -78,7 +79,13 @@ def read_contents(
         sort_by=sort_by,
         sort_order=sort_order,
     )
-    return contents
+    if _msgspec.HAS_MSGSPEC:
+        # Encode straight from the rows; response_model still documents the shape
+        return Response(
+            content=_msgspec.encode_rows(_msgspec.ContentPieceReadMsg, contents),
+            media_type="application/json",
+        )
+    return ContentPieceRead.from_rows(contents)
 
 
 @router.post("/", response_model=ContentPieceRead)
@@ -146,7 +153,7 @@ def read_content(
         if not client_profile or content.client_id != client_profile.id:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions")
 
-    return content
+    return ContentPieceRead.from_orm_fast(content)
 
 
 @router.put("/{content_id}", response_model=ContentPieceRead)
@@ -531,7 +538,7 @@ async def post_content_now(
                     }
                     
                     logger.info(f"Registering upload for {attachment}")
-                    register_response = requests.post(register_url, headers=register_headers, json=register_data)
+                    register_response = await linkedin_http.client.post(register_url, headers=register_headers, json=register_data)
                     register_response.raise_for_status()
                     upload_data = register_response.json()
                     logger.info(f"Upload registration response: {upload_data}")
@@ -548,7 +555,7 @@ async def post_content_now(
                         
                     logger.info(f"Uploading file {file_path} to LinkedIn")
                     with open(file_path, "rb") as f:
-                        upload_response = requests.put(upload_url, data=f.read(), headers={"Authorization": f"Bearer {access_token}"})
+                        upload_response = await linkedin_http.client.put(upload_url, content=f.read(), headers={"Authorization": f"Bearer {access_token}"})
                         upload_response.raise_for_status()
                     logger.info(f"File uploaded successfully, asset: {asset}")
                     
@@ -677,7 +684,7 @@ async def schedule_content(
                     }
                     
                     logger.info(f"Registering upload for {attachment}")
-                    register_response = requests.post(register_url, headers=register_headers, json=register_data)
+                    register_response = await linkedin_http.client.post(register_url, headers=register_headers, json=register_data)
                     register_response.raise_for_status()
                     upload_data = register_response.json()
                     logger.info(f"Upload registration response: {upload_data}")
@@ -694,7 +701,7 @@ async def schedule_content(
                         
                     logger.info(f"Uploading file {file_path} to LinkedIn")
                     with open(file_path, "rb") as f:
-                        upload_response = requests.put(upload_url, data=f.read(), headers={"Authorization": f"Bearer {access_token}"})
+                        upload_response = await linkedin_http.client.put(upload_url, content=f.read(), headers={"Authorization": f"Bearer {access_token}"})
                         upload_response.raise_for_status()
                     logger.info(f"File uploaded successfully, asset: {asset}")
                     
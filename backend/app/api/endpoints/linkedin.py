@@ -6,15 +6,16 @@ from typing import List, Optional
 from urllib.parse import urlencode
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status, File, UploadFile, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, File, UploadFile, Body
 from fastapi.responses import RedirectResponse
-import requests
+import httpx
 from sqlmodel import Session
 
 from app.core.config import settings
 from app.core.database import get_session
 from app.core import oauth_state_manager # Import the manager
 from app.api import deps # For user dependencies
+from app.models import _msgspec
 from app.models.user import User # Import User model
 from app import crud # Import crud module
 from app.models.scheduled_post import ( # Import scheduled post models
@@ -25,6 +26,7 @@ from app.models.scheduled_post import ( # Import scheduled post models
 )
 from app.core.security import decrypt_data # Import decrypt_data
 from app.crud.scheduled_post import PostDeletionError # Import PostDeletionError
+from app.services import linkedin_http
 from app.utils.file_utils import save_upload_file
 
 router = APIRouter()
@@ -125,7 +127,7 @@ async def linkedin_connection_callback(
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
     try:
-        response = requests.post(token_url, data=token_payload, headers=headers, timeout=15)
+        response = await linkedin_http.client.post(token_url, data=token_payload, headers=headers, timeout=15)
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
         token_data = response.json()
         access_token = token_data.get("access_token")
@@ -141,7 +143,7 @@ async def linkedin_connection_callback(
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
         logger.info(f"Token will expire at: {expires_at.isoformat()}")
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_detail = str(e)
         logger.error(f"LinkedIn token exchange failed: {error_detail}")
         return _redirect_to_frontend({"linkedin_status": "error", "detail": f"Token exchange failed: {error_detail}"})
@@ -154,7 +156,7 @@ async def linkedin_connection_callback(
     auth_header = {"Authorization": f"Bearer {access_token}"}
 
     try:
-        userinfo_response = requests.get(userinfo_url, headers=auth_header, timeout=10)
+        userinfo_response = await linkedin_http.client.get(userinfo_url, headers=auth_header, timeout=10)
         userinfo_response.raise_for_status()
         userinfo_data = userinfo_response.json()
         linkedin_id = userinfo_data.get("sub") # 'sub' is the standard OpenID field for user ID
@@ -162,7 +164,7 @@ async def linkedin_connection_callback(
         if not linkedin_id:
             raise ValueError("LinkedIn ID ('sub') not found in userinfo response.")
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         error_detail = str(e)
         logger.error(f"Failed to fetch LinkedIn userinfo: {error_detail}")
         return _redirect_to_frontend({"linkedin_status": "error", "detail": f"Failed to fetch LinkedIn userinfo: {error_detail}"})
@@ -278,7 +280,13 @@ async def list_scheduled_posts(
     posts = crud.scheduled_post.get_scheduled_posts_by_user(
         session=session, user_id=current_user.id, skip=skip, limit=limit
     )
-    return posts
+    if _msgspec.HAS_MSGSPEC:
+        # Encode straight from the rows; response_model still documents the shape
+        return Response(
+            content=_msgspec.encode_rows(_msgspec.ScheduledLinkedInPostReadMsg, posts),
+            media_type="application/json",
+        )
+    return ScheduledLinkedInPostRead.from_rows(posts)
 
 
 @router.delete("/schedule/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -325,7 +333,7 @@ async def get_scheduled_post(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Scheduled post not found or you do not have permission to view it."
         )
-    return post
+    return ScheduledLinkedInPostRead.from_orm_fast(post)
 
 
 @router.post("/disconnect", summary="Disconnect LinkedIn Account")
@@ -449,7 +457,7 @@ async def register_upload(
         logger.info(f"Sending registration request to LinkedIn for user {current_user.id}")
         logger.debug(f"Request data: {data}")
         
-        response = requests.post(register_url, headers=headers, json=data)
+        response = await linkedin_http.client.post(register_url, headers=headers, json=data)
         response.raise_for_status()
         
         upload_info = response.json()
@@ -463,7 +471,7 @@ async def register_upload(
         logger.info(f"Returning upload info for user {current_user.id}")
         return result
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"LinkedIn API error for user {current_user.id}: {str(e)}")
         logger.error(f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}")
         raise HTTPException(
@@ -522,7 +530,7 @@ async def upload_asset(
         }
         
         logger.info(f"Getting upload URL for user {current_user.id}")
-        response = requests.post(register_url, headers=headers, json=data)
+        response = await linkedin_http.client.post(register_url, headers=headers, json=data)
         response.raise_for_status()
         upload_info = response.json()
         upload_url = upload_info["value"]["uploadMechanism"]["com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest"]["uploadUrl"]
@@ -535,7 +543,7 @@ async def upload_asset(
         
         file_content = await file.read()
         logger.info(f"Uploading file to LinkedIn for user {current_user.id}")
-        upload_response = requests.put(upload_url, headers=upload_headers, data=file_content)
+        upload_response = await linkedin_http.client.put(upload_url, headers=upload_headers, content=file_content)
         upload_response.raise_for_status()
         logger.info(f"File uploaded successfully for user {current_user.id}")
         
@@ -544,7 +552,7 @@ async def upload_asset(
             "status": "READY"
         }
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"LinkedIn API error for user {current_user.id}: {str(e)}")
         logger.error(f"Response content: {e.response.content if hasattr(e, 'response') else 'No response content'}")
         raise HTTPException(
@@ -609,12 +617,12 @@ async def create_post(
             }
         }
         
-        response = requests.post(url, headers=headers, json=payload)
+        response = await linkedin_http.client.post(url, headers=headers, json=payload)
         response.raise_for_status()
         
         return response.json()
         
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"LinkedIn API error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -33,7 +33,7 @@ def read_strategies(
     strategies = crud.get_strategies(
         session, skip=skip, limit=limit, active_only=active_only
     )
-    return strategies
+    return StrategyRead.from_rows(strategies)
 
 
 @router.post("/", response_model=StrategyRead)
@@ -100,7 +100,7 @@ def read_strategy(
                 detail="Not enough permissions",
             )
     
-    return strategy
+    return StrategyRead.from_orm_fast(strategy)
 
 
 @router.get("/client/{client_id}", response_model=StrategyRead)
@@ -3,17 +3,38 @@ Users API endpoints module.
 
 This module contains API endpoints for user management.
 """
+import logging
 from typing import Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import defer, selectinload
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_admin_user, get_current_user, get_session
 from app.crud import user as user_crud
-from app.crud import client as client_crud # Import client crud
 from app.models.user import User, UserCreate, UserRead, UserUpdate, UserRole # Import UserRole
+from app.schemas import USER_READ_ADAPTER, USER_READ_LIST_ADAPTER
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# Columns UserRead never exposes; listing users skips fetching them
+_DEFER_PRIVATE_COLUMNS = (
+    defer(User.hashed_password),
+    defer(User.linkedin_access_token),
+    defer(User.linkedin_token_expires_at),
+    defer(User.linkedin_scopes),
+)
+
+
+def _user_response(user: User) -> Response:
+    """
+    Render a user as UserRead JSON without FastAPI's response_model round-trip.
+    """
+    return Response(
+        USER_READ_ADAPTER.dump_json(UserRead.from_orm_fast(user)),
+        media_type="application/json",
+    )
 
 
 @router.get("/", response_model=List[UserRead])
@@ -26,17 +47,17 @@ def read_users(
     """
     Retrieve users.
     """
-    users = session.exec(select(User).offset(skip).limit(limit)).all()
-    # Manually populate client_id for each user before returning
-    users_read = []
-    for user in users:
-        user_data = UserRead.model_validate(user)
-        # Eagerly load or query profile if needed
-        profile = client_crud.get_by_user_id(session, user_id=user.id)
-        if profile:
-            user_data.client_id = profile.id
-        users_read.append(user_data)
-    return users_read
+    # Client profiles (for client_id) come in one extra IN query, not one per user
+    users = session.exec(
+        select(User)
+        .options(selectinload(User.client_profile), *_DEFER_PRIVATE_COLUMNS)
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    return Response(
+        USER_READ_LIST_ADAPTER.dump_json(UserRead.from_rows(users)),
+        media_type="application/json",
+    )
 
 
 @router.get("/me", response_model=UserRead)
@@ -47,19 +68,16 @@ def read_user_me(
     """
     Get current user. Includes client_id if applicable.
     """
-    # Create the UserRead object from the current user
-    user_data = UserRead.model_validate(current_user)
-
-    # Explicitly query for the client profile if the user is a client
-    if current_user.role == UserRole.CLIENT:
-        client_profile = client_crud.get_by_user_id(session, user_id=current_user.id)
-        if client_profile:
-            user_data.client_id = client_profile.id
-        else:
-            # Log a warning if a client user has no profile - indicates data inconsistency
-            print(f"Warning: Client user {current_user.email} (ID: {current_user.id}) has no associated client profile.")
+    # client_id is derived from the client_profile relationship
+    if current_user.role == UserRole.CLIENT and current_user.client_profile is None:
+        # Log a warning if a client user has no profile - indicates data inconsistency
+        logger.warning(
+            "Client user %s (ID: %s) has no associated client profile.",
+            current_user.email,
+            current_user.id,
+        )
 
-    return user_data
+    return _user_response(current_user)
 
 
 @router.get("/{user_id}", response_model=UserRead)
@@ -77,13 +95,7 @@ def read_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    # Manually populate client_id before returning
-    user_data = UserRead.model_validate(user)
-    if user.role == UserRole.CLIENT:
-        profile = client_crud.get_by_user_id(session, user_id=user.id)
-        if profile:
-            user_data.client_id = profile.id
-    return user_data
+    return _user_response(user)
 
 
 @router.post("/", response_model=UserRead)
@@ -102,10 +114,7 @@ def create_user(
             detail="User with this email already exists",
         )
     user = user_crud.create(session, obj_in=user_in)
-    # Manually populate client_id before returning (will be None here)
-    user_data = UserRead.model_validate(user)
-    user_data.client_id = None # Explicitly set to None as profile is not created here
-    return user_data
+    return _user_response(user)
 
 
 @router.put("/{user_id}", response_model=UserRead)
@@ -125,13 +134,7 @@ def update_user(
             detail="User not found",
         )
     user = user_crud.update(session, db_obj=user, obj_in=user_in)
-    # Manually populate client_id before returning
-    user_data = UserRead.model_validate(user)
-    if user.role == UserRole.CLIENT:
-        profile = client_crud.get_by_user_id(session, user_id=user.id)
-        if profile:
-            user_data.client_id = profile.id
-    return user_data
+    return _user_response(user)
 
 
 @router.put("/me", response_model=UserRead)
@@ -144,10 +147,4 @@ def update_user_me(
     Update current user.
     """
     user = user_crud.update(session, db_obj=current_user, obj_in=user_in)
-    # Manually populate client_id before returning
-    user_data = UserRead.model_validate(user)
-    if user.role == UserRole.CLIENT:
-        profile = client_crud.get_by_user_id(session, user_id=user.id)
-        if profile:
-            user_data.client_id = profile.id
-    return user_data
+    return _user_response(user)
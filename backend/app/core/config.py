@@ -25,6 +25,7 @@ class Settings(BaseSettings):
         API_V1_STR: API version prefix
         SECRET_KEY: Secret key for JWT token generation
         ACCESS_TOKEN_EXPIRE_MINUTES: Expiration time for access tokens in minutes
+        BCRYPT_ROUNDS: bcrypt cost factor for password hashes (the test suite lowers it)
         BACKEND_CORS_ORIGINS: Comma-separated string of origins allowed for CORS
         DATABASE_URL: PostgreSQL database connection string
         FIRST_SUPERUSER_EMAIL: Email for the first admin user created on startup
@@ -33,6 +34,7 @@ class Settings(BaseSettings):
         LINKEDIN_CLIENT_SECRET: Client Secret for LinkedIn OAuth
         LINKEDIN_REDIRECT_URI: Redirect URI configured in LinkedIn App
         FRONTEND_URL_BASE: Base URL of the frontend application (for redirects)
+        SCHEDULER_ENABLED: Whether this deployment runs the LinkedIn publishing scheduler
     """
     PROJECT_NAME: str = "Winning Sales Content Hub"
     API_V1_STR: str = "/api/v1"
@@ -40,6 +42,8 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
+    # bcrypt cost factor; each step doubles hashing time. Tests use the minimum (4).
+    BCRYPT_ROUNDS: int = 12
 
     @validator("ACCESS_TOKEN_EXPIRE_MINUTES", pre=True)
     def parse_access_token_expire_minutes(cls, v: Any) -> int:
@@ -71,6 +75,9 @@ class Settings(BaseSettings):
     # Frontend URL (for redirects etc.)
     FRONTEND_URL_BASE: str = "http://localhost:3000" # Default for local dev
 
+    # Scheduler (only one worker per host starts it; disable for API-only replicas)
+    SCHEDULER_ENABLED: bool = True
+
     # Use model_config instead of Config class for Pydantic v2+
     model_config = SettingsConfigDict(
         case_sensitive=True,
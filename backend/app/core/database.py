@@ -3,6 +3,7 @@ Database connection module.
 
 This module provides the database session and engine for the application.
 """
+from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel, Session, create_engine
 from typing import Generator
 
@@ -15,6 +16,9 @@ engine = create_engine(
     echo=False,  # Set to True to see SQL queries in console
 )
 
+# Session factory for code outside request handling (e.g. the setup scripts)
+SessionLocal = sessionmaker(bind=engine, class_=Session)
+
 
 def create_db_and_tables() -> None:
     """
@@ -4,20 +4,31 @@ Security related utilities.
 Includes password hashing, token creation/verification, and data encryption.
 """
 import base64
+import logging
+import os
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone # Ensure timezone is imported
 from typing import Any, Union, Optional
 
 from jose import jwt
 from jose.exceptions import JWTError
 from passlib.context import CryptContext
+from cryptography.exceptions import InvalidTag
 from cryptography.fernet import Fernet, InvalidToken # Import Fernet and InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 # --- Encryption Setup ---
 # Derive a stable encryption key from the SECRET_KEY using PBKDF2
@@ -25,39 +36,71 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # Use a static salt or store it securely if needed across restarts/deployments
 # For simplicity here, using a hardcoded salt (NOT RECOMMENDED FOR HIGH SECURITY)
 _SALT = b'qN38_Tr!z9-f$5@L' # Replace with a securely generated and stored salt in production
-_kdf = PBKDF2HMAC(
-    algorithm=hashes.SHA256(),
-    length=32,
-    salt=_SALT,
-    iterations=480000, # Adjust iterations as needed for performance/security balance
-)
-_ENCRYPTION_KEY = base64.urlsafe_b64encode(_kdf.derive(settings.SECRET_KEY.encode()))
-_fernet = Fernet(_ENCRYPTION_KEY)
+
+
+# Prefix marking AES-GCM ciphertexts; values without it are legacy Fernet tokens
+_AESGCM_PREFIX = "v2:"
+_NONCE_SIZE = 12
+
+
+@lru_cache(maxsize=1)
+def _derive_key() -> bytes:
+    """
+    Derive the 32-byte encryption key from SECRET_KEY on first use.
+
+    The PBKDF2 derivation is deliberately slow, so it runs once per process
+    (and not at import time) and the key is reused.
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=_SALT,
+        iterations=480000, # Adjust iterations as needed for performance/security balance
+    )
+    return kdf.derive(settings.SECRET_KEY.encode())
+
+
+@lru_cache(maxsize=1)
+def _get_aesgcm() -> AESGCM:
+    """Return the process-wide AES-256-GCM cipher (OpenSSL, AES-NI where available)."""
+    return AESGCM(_derive_key())
+
+
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Return the Fernet instance used to read tokens encrypted before AES-GCM."""
+    return Fernet(base64.urlsafe_b64encode(_derive_key()))
+
 
 def encrypt_data(data: str) -> str:
-    """Encrypts a string using Fernet."""
+    """Encrypts a string using AES-256-GCM."""
     if not data:
         return data
     try:
-        return _fernet.encrypt(data.encode()).decode()
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = _get_aesgcm().encrypt(nonce, data.encode(), None)
+        return _AESGCM_PREFIX + base64.urlsafe_b64encode(nonce + ciphertext).decode()
     except Exception as e:
         # Log encryption error
-        print(f"Encryption failed: {e}")
+        logger.error("Encryption failed: %s", e)
         raise ValueError("Data encryption failed") from e
 
 def decrypt_data(encrypted_data: str) -> Optional[str]:
-    """Decrypts a string using Fernet. Returns None if decryption fails."""
+    """Decrypts a string encrypted by encrypt_data. Returns None if decryption fails."""
     if not encrypted_data:
         return None
     try:
-        return _fernet.decrypt(encrypted_data.encode()).decode()
-    except InvalidToken:
+        if encrypted_data.startswith(_AESGCM_PREFIX):
+            raw = base64.urlsafe_b64decode(encrypted_data[len(_AESGCM_PREFIX):])
+            return _get_aesgcm().decrypt(raw[:_NONCE_SIZE], raw[_NONCE_SIZE:], None).decode()
+        return _get_fernet().decrypt(encrypted_data.encode()).decode()
+    except (InvalidToken, InvalidTag):
         # Log decryption error (e.g., invalid token, key mismatch)
-        print(f"Decryption failed: Invalid token or key")
+        logger.warning("Decryption failed: Invalid token or key")
         return None
     except Exception as e:
         # Log other decryption errors
-        print(f"Decryption failed: {e}")
+        logger.error("Decryption failed: %s", e)
         return None
 
 # --- Password Hashing ---
@@ -23,6 +23,7 @@ from app.crud.client import (
     get_by_user_id,
     get_multi as get_clients,
     create as create_client,
+    create_many as create_clients,
     update as update_client,
     delete as delete_client,
 )
@@ -52,9 +53,11 @@ from app.crud.content import (
 # Re-export scheduled_post CRUD operations (optional, but good practice)
 from app.crud.scheduled_post import (
     create_scheduled_post,
+    create_scheduled_posts,
     get_scheduled_post,
     get_scheduled_posts_by_user,
     get_pending_posts_to_publish,
+    fail_exhausted_posts,
     update_post_status,
     delete_scheduled_post,
 )
@@ -78,6 +81,7 @@ __all__ = [
     "get_by_user_id",
     "get_clients",
     "create_client",
+    "create_clients",
     "update_client",
     "delete_client",
     "get_strategy",
@@ -95,9 +99,11 @@ __all__ = [
     "mark_as_posted",
     "rate_content", # Add rate_content to __all__
     "create_scheduled_post", # Add scheduled post functions
+    "create_scheduled_posts",
     "get_scheduled_post",
     "get_scheduled_posts_by_user",
     "get_pending_posts_to_publish",
+    "fail_exhausted_posts",
     "update_post_status",
     "delete_scheduled_post",
 ]
@@ -5,13 +5,13 @@ This module contains CRUD operations for the ClientProfile model.
 """
 from typing import List, Optional, Union, Dict, Any
 
+from sqlalchemy.orm import joinedload, selectinload
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
 
 from app.models.client import ClientProfile, ClientProfileCreate, ClientProfileUpdate
 from app.models.user import User, UserRole, UserCreate
-from app.models.strategy import Strategy
-from app.models.content import ContentPiece
+from app.core.security import get_password_hash
 from app.crud.user import create as create_user, get_by_email
 
 
@@ -116,6 +116,62 @@ def create(session: Session, *, obj_in: ClientProfileCreate) -> ClientProfile:
     return db_obj
 
 
+def create_many(
+    session: Session, *, objs_in: List[ClientProfileCreate]
+) -> List[ClientProfile]:
+    """
+    Create several client users and their profiles in a single transaction.
+
+    Users are flushed together to get their IDs, then all profiles are
+    added and committed once, instead of the two commits per client
+    that create() makes.
+
+    Args:
+        session: Database session
+        objs_in: Client profile and user creation data
+
+    Returns:
+        List[ClientProfile]: Created client profiles, in the same order as objs_in
+
+    Raises:
+        HTTPException: If any email is already taken or repeated in objs_in.
+    """
+    if not objs_in:
+        return []
+
+    emails = [obj_in.email for obj_in in objs_in]
+    taken = session.exec(select(User.email).where(User.email.in_(emails))).first()
+    if taken or len(set(emails)) != len(emails):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A user with this email already exists.",
+        )
+
+    users = [
+        User(
+            email=obj_in.email,
+            hashed_password=get_password_hash(obj_in.password),
+            full_name=obj_in.full_name or obj_in.company_name,
+            role=UserRole.CLIENT,
+            is_active=True,
+        )
+        for obj_in in objs_in
+    ]
+    session.add_all(users)
+    session.flush()
+
+    db_objs = [
+        ClientProfile(
+            **obj_in.model_dump(exclude={"email", "password", "full_name"}),
+            user_id=user.id,
+        )
+        for obj_in, user in zip(objs_in, users)
+    ]
+    session.add_all(db_objs)
+    session.commit()
+    return db_objs
+
+
 def update(
     session: Session,
     *,
@@ -165,35 +221,38 @@ def delete(session: Session, *, client_id: int) -> Optional[ClientProfile]:
     """
     try:
         print(f"Starting deletion of client {client_id}")
-        client = session.get(ClientProfile, client_id)
+        # Strategy (1-1) comes back in the same query via a JOIN and the content
+        # pieces (1-many) in a single extra IN query
+        client = session.exec(
+            select(ClientProfile)
+            .where(ClientProfile.id == client_id)
+            .options(
+                joinedload(ClientProfile.strategy),
+                selectinload(ClientProfile.content_pieces),
+            )
+        ).first()
         if not client:
             print(f"Client {client_id} not found")
             return None
             
         print(f"Found client {client_id}, checking for associated data")
+        strategy = client.strategy
+        content_pieces = list(client.content_pieces)
         
         # Check for associated strategy
-        strategy = session.exec(
-            select(Strategy).where(Strategy.client_id == client_id)
-        ).first()
         if strategy:
             print(f"Found strategy {strategy.id} for client {client_id}")
             session.delete(strategy)
-            session.commit()
             print(f"Deleted strategy {strategy.id}")
                 
         # Check for associated content pieces
-        content_pieces = session.exec(
-            select(ContentPiece).where(ContentPiece.client_id == client_id)
-        ).all()
         if content_pieces:
             print(f"Found {len(content_pieces)} content pieces for client {client_id}")
             for piece in content_pieces:
                 session.delete(piece)
-            session.commit()
             print(f"Deleted all content pieces")
                 
-        # Delete client profile
+        # Delete client profile; everything above goes out in this one commit
         print(f"Deleting client profile {client_id}")
         session.delete(client)
         session.commit()
@@ -6,7 +6,6 @@ This module contains CRUD operations for the ContentPiece model.
 from typing import List, Optional, Union, Dict, Any
 from datetime import datetime
 import bleach # Import bleach for sanitization
-import os
 import logging
 from fastapi import UploadFile
 import json
@@ -127,19 +126,7 @@ class CRUDContent(CRUDBase[ContentPiece, ContentPieceCreate, ContentPieceUpdate]
                     
                     for attachment in db_obj.attachments:
                         try:
-                            upload_info = await linkedinService.register_upload(
-                                access_token=user.linkedin_access_token,
-                                user_id=user.linkedin_id,
-                                file_type="image/jpeg",  # TODO: визначити тип файлу
-                                file_size=os.path.getsize(attachment)
-                            )
-                            
-                            await linkedinService.upload_file(
-                                upload_url=upload_info["uploadUrl"],
-                                file_path=attachment
-                            )
-                            
-                            media_assets.append(upload_info["asset"])
+                            media_assets.append(await upload_to_linkedin(attachment, user))
                         except Exception as e:
                             logger.error(f"Failed to upload {attachment} to LinkedIn: {str(e)}")
                             continue
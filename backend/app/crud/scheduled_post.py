@@ -5,6 +5,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 from fastapi import status
 from sqlmodel import Session, select
+from sqlalchemy import func, insert, update
 
 from app.models.scheduled_post import (
     ScheduledLinkedInPost,
@@ -41,6 +42,37 @@ def create_scheduled_post(
     return db_obj
 
 
+def create_scheduled_posts(
+    session: Session, *, objs_in: List[ScheduledLinkedInPostCreate]
+) -> List[int]:
+    """
+    Create many scheduled LinkedIn post records in one INSERT ... RETURNING round-trip.
+
+    Args:
+        session: Database session.
+        objs_in: Data for the new scheduled posts.
+
+    Returns:
+        The IDs of the created posts, in the same order as objs_in.
+    """
+    if not objs_in:
+        return []
+
+    # Validate through the table model so column defaults (status, retry_count) are filled in
+    rows = [
+        ScheduledLinkedInPost.model_validate(obj_in).model_dump(
+            exclude={"id", "created_at", "updated_at"}
+        )
+        for obj_in in objs_in
+    ]
+    statement = insert(ScheduledLinkedInPost).returning(
+        ScheduledLinkedInPost.id, sort_by_parameter_order=True
+    )
+    ids = list(session.execute(statement, rows).scalars())
+    session.commit()
+    return ids
+
+
 def get_scheduled_post(session: Session, post_id: int) -> Optional[ScheduledLinkedInPost]:
     """
     Get a scheduled post by its ID.
@@ -80,13 +112,17 @@ def get_scheduled_posts_by_user(
     return session.exec(statement).all()
 
 
-def get_pending_posts_to_publish(session: Session, *, now: datetime) -> List[ScheduledLinkedInPost]:
+def get_pending_posts_to_publish(
+    session: Session, *, now: datetime, max_retries: Optional[int] = None
+) -> List[ScheduledLinkedInPost]:
     """
     Get all pending scheduled posts that are due to be published.
 
     Args:
         session: Database session.
         now: The current time (timezone-aware recommended).
+        max_retries: If given, only posts that still have an attempt left
+            (retry_count <= max_retries) are returned.
 
     Returns:
         A list of pending ScheduledLinkedInPost objects ready for publishing.
@@ -95,24 +131,14 @@ def get_pending_posts_to_publish(session: Session, *, now: datetime) -> List[Sch
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
 
-    # Get all pending posts first
-    all_pending = session.exec(
-        select(ScheduledLinkedInPost)
-        .where(ScheduledLinkedInPost.status == PostStatus.PENDING)
-    ).all()
-
-    for post in all_pending:
-        # Ensure post.scheduled_at is timezone-aware
-        if post.scheduled_at and post.scheduled_at.tzinfo is None:
-            post.scheduled_at = post.scheduled_at.replace(tzinfo=timezone.utc)
-            
-    # Then filter by scheduled time - convert now to UTC for comparison
     statement = (
         select(ScheduledLinkedInPost)
         .where(ScheduledLinkedInPost.status == PostStatus.PENDING)
         .where(ScheduledLinkedInPost.scheduled_at <= now)
         .order_by(ScheduledLinkedInPost.scheduled_at) # Process oldest first
     )
+    if max_retries is not None:
+        statement = statement.where(ScheduledLinkedInPost.retry_count <= max_retries)
     posts = session.exec(statement).all()
 
     for post in posts:
@@ -123,6 +149,40 @@ def get_pending_posts_to_publish(session: Session, *, now: datetime) -> List[Sch
     return posts
 
 
+def fail_exhausted_posts(session: Session, *, now: datetime, max_retries: int) -> int:
+    """
+    Mark every due pending post that has used up its retries as FAILED in a single UPDATE.
+
+    The last publishing error is kept, with a max-retries note appended.
+
+    Args:
+        session: Database session.
+        now: The current time (timezone-aware recommended).
+        max_retries: Posts with more retries than this are failed.
+
+    Returns:
+        The number of posts marked as failed.
+    """
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+
+    statement = (
+        update(ScheduledLinkedInPost)
+        .where(ScheduledLinkedInPost.status == PostStatus.PENDING)
+        .where(ScheduledLinkedInPost.scheduled_at <= now)
+        .where(ScheduledLinkedInPost.retry_count > max_retries)
+        .values(
+            status=PostStatus.FAILED,
+            error_message=func.coalesce(ScheduledLinkedInPost.error_message, "") + " (max retries exceeded)",
+            linkedin_post_id=None,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    result = session.execute(statement)
+    session.commit()
+    return result.rowcount
+
+
 def update_post_status(
     session: Session,
     *,
@@ -6,24 +6,33 @@ import time # Import time for sleep
 from contextlib import asynccontextmanager # Import asynccontextmanager for lifespan
 from datetime import datetime, timezone, timedelta # Import timedelta
 import os # Import os for directory creation
+import tempfile
 import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, Depends, Request # Import Request
+from fastapi import FastAPI, Request # Import Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware # Import BaseHTTPMiddleware
 from starlette.responses import Response # Import Response
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import Session, select
-from apscheduler.schedulers.background import BackgroundScheduler # Import scheduler
-import requests # Import requests for publishing job
+from apscheduler.schedulers.asyncio import AsyncIOScheduler # Import scheduler
+import httpx
+import orjson # Fast JSON encoding for LinkedIn payloads
 from fastapi.staticfiles import StaticFiles # Import StaticFiles
 
 from app.api.api import api_router
 from app.core.config import settings # Import settings
-from app.core.database import create_db_and_tables, get_session, engine # Import engine for session creation in job
+from app.core.database import engine # Import engine for session creation in job
 from app.models.user import User, UserRole # Import User model and Role
+from app.models import warmup as warmup_models
+from app.schemas import warmup as warmup_schemas
 from app.models.scheduled_post import PostStatus # Import PostStatus
 from app.core.security import get_password_hash, decrypt_data # Import decrypt_data
 from app import crud # Import crud
+from app.services import linkedin_http
 
 # Configure logging
 logging.basicConfig(
@@ -33,170 +42,283 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # --- Scheduler Setup ---
-scheduler = BackgroundScheduler(timezone="UTC") # Use UTC for consistency
+# Runs the publish job on the application event loop, so it can share the
+# async LinkedIn client with the request handlers
+scheduler = AsyncIOScheduler(timezone="UTC") # Use UTC for consistency
 MAX_RETRIES = 3 # Define max number of retries
 RETRY_DELAY_MINUTES = 5 # Base delay in minutes for first retry
 
-def is_retryable_error(e: requests.exceptions.RequestException) -> bool:
-    """Check if a requests exception indicates a potentially temporary issue."""
-    if isinstance(e, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+# --- LinkedIn Publishing Requests ---
+# Sent through the shared client in app.services.linkedin_http. Static request
+# parts are built once; only the Authorization header varies per post
+_LINKEDIN_POST_URL = "https://api.linkedin.com/v2/ugcPosts"
+_LINKEDIN_POST_HEADERS = {
+    "X-Restli-Protocol-Version": "2.0.0",
+    "Content-Type": "application/json"
+}
+_ERROR_BODY_LIMIT = 512 # Max characters of a LinkedIn error body to log
+
+def is_retryable_error(e: httpx.HTTPError) -> bool:
+    """Check if an httpx exception indicates a potentially temporary issue."""
+    if isinstance(e, (httpx.TimeoutException, httpx.NetworkError)):
         return True
-    if e.response is not None:
+    if isinstance(e, httpx.HTTPStatusError):
         # Retry on server errors (5xx) and rate limiting (429)
         return e.response.status_code >= 500 or e.response.status_code == 429
     return False
 
-def publish_scheduled_linkedin_posts():
+@dataclass(slots=True)
+class _PublishWork:
+    """A due post that passed validation and is ready to be sent to LinkedIn."""
+    post_id: int
+    content_id: Optional[int]
+    access_token: str
+    payload: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class _PublishOutcome:
+    """Result of sending one post to LinkedIn."""
+    post_id: int
+    content_id: Optional[int]
+    linkedin_post_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+def _build_post_payload(post, user: User) -> Dict[str, Any]:
+    """Build the ugcPosts request body for a scheduled post."""
+    formatted_content = re.sub(r'<p>(.*?)</p>', r'\1\n', post.content_text)
+    formatted_content = re.sub(r'<[^>]+>', '', formatted_content)
+    formatted_content = re.sub(r'\n\s*\n', '\n\n', formatted_content).strip()
+
+    logger.debug("Original content: %s", post.content_text)
+    logger.debug("Formatted content: %s", formatted_content)
+
+    post_payload = {
+        "author": f"urn:li:person:{user.linkedin_id}",
+        "lifecycleState": "PUBLISHED",
+        "specificContent": {
+            "com.linkedin.ugc.ShareContent": {
+                "shareCommentary": {
+                    "text": formatted_content
+                },
+                "shareMediaCategory": "NONE"
+            }
+        },
+        "visibility": {
+            "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+        }
+    }
+
+    # Add media if present
+    media_assets = post.media_assets
+    if media_assets:
+        logger.debug("Adding media assets to post: %s", media_assets)
+        share_content = post_payload["specificContent"]["com.linkedin.ugc.ShareContent"]
+        share_content["shareMediaCategory"] = "IMAGE"
+        share_content["media"] = media_assets
+
+    logger.debug("Scheduler: Post payload: %s", post_payload)
+    return post_payload
+
+
+def _load_work(engine, now: datetime) -> List[_PublishWork]:
     """
-    Job function executed by the scheduler to publish due posts.
-    Includes retry logic for transient errors.
+    Phase 1: fetch due posts and their users in a short-lived session.
+
+    Posts that can never be published (missing user, unusable token, missing
+    scope) are failed here; the rest are returned as detached work items so no
+    DB connection is held while talking to LinkedIn.
     """
-    logger.info("Scheduler: Starting LinkedIn post publishing job...")
+    work: List[_PublishWork] = []
     with Session(engine) as session:
-        try:
-            now = datetime.now(timezone.utc)
-            logger.info(f"Scheduler: Current time (UTC): {now.isoformat()}")
-            
-            # Fetch posts scheduled for now or earlier, AND whose retry count is acceptable
-            pending_posts = crud.scheduled_post.get_pending_posts_to_publish(session=session, now=now)
-            logger.info(f"Scheduler: Found {len(pending_posts)} posts due for publishing.")
-            
-            if not pending_posts:
-                logger.info("Scheduler: No posts to publish at this time.")
-                return
-
-            for post in pending_posts:
-                logger.info(f"Scheduler: Processing post ID {post.id} (scheduled for {post.scheduled_at.isoformat()})")
-                
-                # Convert scheduled_at to UTC if it's naive
-                scheduled_at = post.scheduled_at
-                if scheduled_at.tzinfo is None:
-                    scheduled_at = scheduled_at.replace(tzinfo=timezone.utc)
-                
-                # Skip if already processed in this run
-                if post.status != PostStatus.PENDING or scheduled_at > now:
-                    logger.info(f"Scheduler: Skipping post ID {post.id} - status: {post.status}, scheduled_at: {scheduled_at.isoformat()}")
-                    continue
-
-                logger.info(f"Scheduler: Attempting to publish post ID {post.id} (Retry {post.retry_count}) for user ID {post.user_id}")
-                user = crud.user.get(session=session, user_id=post.user_id)
-                error_message_prefix = f"Failed Post ID {post.id}: "
-
-                if not user:
-                    logger.error(f"Scheduler: User ID {post.user_id} not found for post ID {post.id}. Failing permanently.")
-                    crud.scheduled_post.update_post_status(
-                        session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "User not found"
-                    )
-                    continue
-
-                # Decrypt the stored access token
-                decrypted_access_token = None
-                if user.linkedin_access_token:
-                    try:
-                        decrypted_access_token = decrypt_data(user.linkedin_access_token)
-                        logger.info(f"Scheduler: Successfully decrypted token for user ID {user.id}")
-                    except Exception as e:
-                        logger.error(f"Scheduler: Failed to decrypt token for user ID {user.id}: {e}")
-                        decrypted_access_token = None
-
-                # Check token validity
-                token_expires_at = user.linkedin_token_expires_at
-                if token_expires_at and token_expires_at.tzinfo is None:
-                    token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
-
-                if not decrypted_access_token or not token_expires_at or token_expires_at <= now:
-                    logger.warning(f"Scheduler: LinkedIn token invalid, expired, or failed decryption for user ID {user.id}, post ID {post.id}. Failing permanently.")
-                    crud.scheduled_post.update_post_status(
-                        session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "Token expired or invalid/decryption failed"
-                    )
-                    continue
-
-                # Check scope
-                scopes_list = []
-                if user.linkedin_scopes:
-                    scopes_list = [s.strip() for s in user.linkedin_scopes.replace(',', ' ').split()]
-                    logger.info(f"Scheduler: User ID {user.id} has scopes: {scopes_list}")
-
-                if "w_member_social" not in scopes_list:
-                    logger.warning(f"Scheduler: Missing 'w_member_social' scope for user ID {user.id}, post ID {post.id}. Granted: '{user.linkedin_scopes}'")
-                    crud.scheduled_post.update_post_status(
-                        session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "Missing required scope 'w_member_social'"
-                    )
-                    continue
-
-                # Construct post payload
-                formatted_content = re.sub(r'<p>(.*?)</p>', r'\1\n', post.content_text)
-                formatted_content = re.sub(r'<[^>]+>', '', formatted_content)
-                formatted_content = re.sub(r'\n\s*\n', '\n\n', formatted_content).strip()
-
-                logger.info(f"Original content: {post.content_text}")
-                logger.info(f"Formatted content: {formatted_content}")
-
-                post_payload = {
-                    "author": f"urn:li:person:{user.linkedin_id}",
-                    "lifecycleState": "PUBLISHED",
-                    "specificContent": {
-                        "com.linkedin.ugc.ShareContent": {
-                            "shareCommentary": {
-                                "text": formatted_content
-                            },
-                            "shareMediaCategory": "NONE"
-                        }
-                    },
-                    "visibility": {
-                        "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-                    }
-                }
-
-                # Add media if present
-                if post.media_assets:
-                    logger.info(f"Adding media assets to post: {post.media_assets}")
-                    post_payload["specificContent"]["com.linkedin.ugc.ShareContent"]["shareMediaCategory"] = "IMAGE"
-                    post_payload["specificContent"]["com.linkedin.ugc.ShareContent"]["media"] = post.media_assets
-                    logger.info(f"Updated post payload with media: {post_payload}")
-
-                logger.info(f"Scheduler: Post payload: {post_payload}")
-                headers = {
-                    "Authorization": f"Bearer {decrypted_access_token}",
-                    "X-Restli-Protocol-Version": "2.0.0",
-                    "Content-Type": "application/json"
-                }
-                linkedin_post_url = "https://api.linkedin.com/v2/ugcPosts"
-
-                logger.info(f"Scheduler: Sending request to LinkedIn API for post ID {post.id}")
+        exhausted = crud.scheduled_post.fail_exhausted_posts(session=session, now=now, max_retries=MAX_RETRIES)
+        if exhausted:
+            logger.warning(f"Scheduler: Marked {exhausted} posts as failed after exceeding {MAX_RETRIES} retries.")
+
+        pending_posts = crud.scheduled_post.get_pending_posts_to_publish(session=session, now=now, max_retries=MAX_RETRIES)
+        logger.info(f"Scheduler: Found {len(pending_posts)} posts due for publishing.")
+
+        for post in pending_posts:
+            logger.info(f"Scheduler: Processing post ID {post.id} (scheduled for {post.scheduled_at.isoformat()})")
+
+            # Skip if already processed in this run (scheduled_at is stored as TIMESTAMPTZ)
+            if post.status != PostStatus.PENDING or post.scheduled_at > now:
+                logger.info(f"Scheduler: Skipping post ID {post.id} - status: {post.status}, scheduled_at: {post.scheduled_at.isoformat()}")
+                continue
+
+            logger.info(f"Scheduler: Attempting to publish post ID {post.id} (Retry {post.retry_count}) for user ID {post.user_id}")
+            user = crud.user.get(session=session, user_id=post.user_id)
+            error_message_prefix = f"Failed Post ID {post.id}: "
+
+            if not user:
+                logger.error(f"Scheduler: User ID {post.user_id} not found for post ID {post.id}. Failing permanently.")
+                crud.scheduled_post.update_post_status(
+                    session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "User not found"
+                )
+                continue
+
+            # Decrypt the stored access token
+            decrypted_access_token = None
+            if user.linkedin_access_token:
                 try:
-                    response = requests.post(linkedin_post_url, headers=headers, json=post_payload, timeout=30)
-                    if response.status_code != 200:
-                        logger.error(f"Scheduler: LinkedIn API error response: {response.text}")
-                    response.raise_for_status()
-                    linkedin_post_id = response.headers.get("X-RestLi-Id") or response.headers.get("x-restli-id")
-                    logger.info(f"Scheduler: Successfully published post ID {post.id} to LinkedIn. LinkedIn Post ID: {linkedin_post_id}")
-                    crud.scheduled_post.update_post_status(
-                        session=session, db_obj=post, status=PostStatus.PUBLISHED, linkedin_post_id=linkedin_post_id
-                    )
-
-                    # If this was a content post, update the content status
-                    if post.content_id:
-                        content = crud.content.get(session=session, content_id=post.content_id)
-                        if content:
-                            crud.content.mark_as_posted(session=session, content_id=post.content_id)
+                    decrypted_access_token = decrypt_data(user.linkedin_access_token)
+                    logger.info(f"Scheduler: Successfully decrypted token for user ID {user.id}")
                 except Exception as e:
-                    logger.error(f"Scheduler: Failed to publish post ID {post.id}: {str(e)}")
-                    # Update retry count and status
-                    crud.scheduled_post.update_post_status(
-                        session=session,
-                        db_obj=post,
-                        status=PostStatus.FAILED if post.retry_count >= 3 else PostStatus.PENDING,
-                        error_message=error_message_prefix + str(e)
-                    )
-                    if post.retry_count < 3:
-                        post.retry_count += 1
-                        session.add(post)
-                        session.commit()
-            logger.info("Scheduler: Finished checking posts.")
+                    logger.error(f"Scheduler: Failed to decrypt token for user ID {user.id}: {e}")
+                    decrypted_access_token = None
+
+            # Check token validity
+            token_expires_at = user.linkedin_token_expires_at
+            if token_expires_at and token_expires_at.tzinfo is None:
+                token_expires_at = token_expires_at.replace(tzinfo=timezone.utc)
+
+            if not decrypted_access_token or not token_expires_at or token_expires_at <= now:
+                logger.warning(f"Scheduler: LinkedIn token invalid, expired, or failed decryption for user ID {user.id}, post ID {post.id}. Failing permanently.")
+                crud.scheduled_post.update_post_status(
+                    session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "Token expired or invalid/decryption failed"
+                )
+                continue
+
+            # Check scope
+            scopes_list = []
+            if user.linkedin_scopes:
+                scopes_list = [s.strip() for s in user.linkedin_scopes.replace(',', ' ').split()]
+                logger.info(f"Scheduler: User ID {user.id} has scopes: {scopes_list}")
+
+            if "w_member_social" not in scopes_list:
+                logger.warning(f"Scheduler: Missing 'w_member_social' scope for user ID {user.id}, post ID {post.id}. Granted: '{user.linkedin_scopes}'")
+                crud.scheduled_post.update_post_status(
+                    session=session, db_obj=post, status=PostStatus.FAILED, error_message=error_message_prefix + "Missing required scope 'w_member_social'"
+                )
+                continue
+
+            work.append(_PublishWork(
+                post_id=post.id,
+                content_id=post.content_id,
+                access_token=decrypted_access_token,
+                payload=_build_post_payload(post, user),
+            ))
+    return work
+
+
+async def _do_http(work: List[_PublishWork]) -> List[_PublishOutcome]:
+    """
+    Phase 2: send each post to LinkedIn. No DB session is held here.
+    """
+    outcomes: List[_PublishOutcome] = []
+    for item in work:
+        headers = {**_LINKEDIN_POST_HEADERS, "Authorization": f"Bearer {item.access_token}"}
+
+        logger.info(f"Scheduler: Sending request to LinkedIn API for post ID {item.post_id}")
+        try:
+            response = await linkedin_http.client.post(_LINKEDIN_POST_URL, headers=headers, content=orjson.dumps(item.payload))
+            if response.status_code >= 400:
+                logger.error("Scheduler: LinkedIn API error response: %s", response.text[:_ERROR_BODY_LIMIT])
+            response.raise_for_status()
+            linkedin_post_id = response.headers.get("X-RestLi-Id") or response.headers.get("x-restli-id")
+            logger.info(f"Scheduler: Successfully published post ID {item.post_id} to LinkedIn. LinkedIn Post ID: {linkedin_post_id}")
+            outcomes.append(_PublishOutcome(post_id=item.post_id, content_id=item.content_id, linkedin_post_id=linkedin_post_id))
         except Exception as e:
-            # Catch broad exceptions during the whole check cycle
-            logger.error(f"Scheduler: Error during post publishing cycle: {e}", exc_info=True)
+            logger.error(f"Scheduler: Failed to publish post ID {item.post_id}: {str(e)}")
+            outcomes.append(_PublishOutcome(post_id=item.post_id, content_id=item.content_id, error=str(e)))
+    return outcomes
+
+
+def _commit_outcomes(engine, outcomes: List[_PublishOutcome]) -> None:
+    """
+    Phase 3: persist publish results in a short-lived session.
+    """
+    with Session(engine) as session:
+        for outcome in outcomes:
+            post = crud.scheduled_post.get_scheduled_post(session, outcome.post_id)
+            if not post:
+                logger.warning(f"Scheduler: Post ID {outcome.post_id} disappeared before its result could be saved.")
+                continue
+
+            if outcome.error is None:
+                crud.scheduled_post.update_post_status(
+                    session=session, db_obj=post, status=PostStatus.PUBLISHED, linkedin_post_id=outcome.linkedin_post_id
+                )
+
+                # If this was a content post, update the content status
+                if outcome.content_id:
+                    try:
+                        content = crud.content.get(session=session, content_id=outcome.content_id)
+                        if content:
+                            crud.content.mark_as_posted(session=session, content_id=outcome.content_id)
+                    except Exception as e:
+                        logger.error(f"Scheduler: Failed to mark content ID {outcome.content_id} as posted: {e}")
+                continue
+
+            # Update retry count and status
+            crud.scheduled_post.update_post_status(
+                session=session,
+                db_obj=post,
+                status=PostStatus.FAILED if post.retry_count >= MAX_RETRIES else PostStatus.PENDING,
+                error_message=f"Failed Post ID {post.id}: " + outcome.error
+            )
+            if post.retry_count < MAX_RETRIES:
+                post.retry_count += 1
+                session.add(post)
+                session.commit()
+
+
+async def publish_scheduled_linkedin_posts():
+    """
+    Job function executed by the scheduler to publish due posts.
+    Includes retry logic for transient errors.
+
+    DB work is split into short sessions before and after the LinkedIn calls so
+    a pooled connection is not held for the duration of the HTTP requests. The
+    sessions run in the threadpool so they do not block the event loop.
+    """
+    logger.info("Scheduler: Starting LinkedIn post publishing job...")
+    try:
+        now = datetime.now(timezone.utc)
+        logger.info(f"Scheduler: Current time (UTC): {now.isoformat()}")
+
+        work = await run_in_threadpool(_load_work, engine, now)
+        if not work:
+            logger.info("Scheduler: No posts to publish at this time.")
+            return
+
+        outcomes = await _do_http(work)
+        await run_in_threadpool(_commit_outcomes, engine, outcomes)
+        logger.info("Scheduler: Finished checking posts.")
+    except Exception as e:
+        # Catch broad exceptions during the whole check cycle
+        logger.error(f"Scheduler: Error during post publishing cycle: {e}", exc_info=True)
+
+
+# --- Scheduler Ownership ---
+# With several Uvicorn workers every process runs the lifespan, but only one may
+# run the publish job or posts would be sent once per worker. The first worker to
+# take an exclusive lock on this file owns the scheduler until it exits.
+_SCHEDULER_LOCK_PATH = os.path.join(tempfile.gettempdir(), "linkedincms-scheduler.lock")
+_scheduler_lock_file = None
+
+
+def _acquire_scheduler_lock() -> bool:
+    """Return True if this process took (or already holds) the scheduler lock."""
+    global _scheduler_lock_file
+    if _scheduler_lock_file is not None:
+        return True
+    try:
+        import fcntl
+    except ImportError:
+        # No flock on this platform; assume a single worker
+        return True
+
+    lock_file = open(_SCHEDULER_LOCK_PATH, "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    # Keep the handle open; the lock is released when the process exits
+    _scheduler_lock_file = lock_file
+    return True
 
 
 # --- FastAPI Lifespan ---
@@ -208,17 +330,26 @@ async def lifespan(app: FastAPI):
     # Create uploads directory if it doesn't exist
     os.makedirs("uploads", exist_ok=True)
     logger.info("Created uploads directory")
-    
-    # Create database tables
-    create_db_and_tables()
-    
-   # Start the scheduler
-    try:
-        scheduler.add_job(publish_scheduled_linkedin_posts, 'interval', minutes=1, id='publish_linkedin_job', replace_existing=True)
-        scheduler.start()
-        logger.info("Scheduler started successfully.")
-    except Exception as e:
-        logger.error(f"Error starting scheduler: {e}", exc_info=True)
+
+    # Schema is managed by Alembic (`alembic upgrade head` in entrypoint.sh),
+    # so workers don't race to create tables on every startup.
+
+    # Configure mappers and model schemas now rather than on the first request
+    warmup_models()
+    warmup_schemas()
+
+    # Start the scheduler (only in the one worker that owns it)
+    if not settings.SCHEDULER_ENABLED:
+        logger.info("Scheduler disabled for this process (SCHEDULER_ENABLED is false).")
+    elif not _acquire_scheduler_lock():
+        logger.info("Scheduler is owned by another worker; not starting it here.")
+    else:
+        try:
+            scheduler.add_job(publish_scheduled_linkedin_posts, 'interval', minutes=1, id='publish_linkedin_job', replace_existing=True)
+            scheduler.start()
+            logger.info("Scheduler started successfully.")
+        except Exception as e:
+            logger.error(f"Error starting scheduler: {e}", exc_info=True)
 
     logger.info("Application startup tasks complete.")
     
@@ -226,11 +357,13 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Running application shutdown tasks...")
-    try:
-        scheduler.shutdown()
-        logger.info("Scheduler shut down gracefully.")
-    except Exception as e:
-        logger.error(f"Error shutting down scheduler: {e}", exc_info=True)
+    if scheduler.running:
+        try:
+            scheduler.shutdown()
+            logger.info("Scheduler shut down gracefully.")
+        except Exception as e:
+            logger.error(f"Error shutting down scheduler: {e}", exc_info=True)
+    await linkedin_http.aclose()
     logger.info("Application shutdown complete.")
 
 
@@ -238,7 +371,8 @@ app = FastAPI(
     title="Winning Sales Content Hub API",
     description="API for managing sales content collaboration between Winning Sales and clients",
     version="0.1.0",
-    lifespan=lifespan # Use the lifespan context manager
+    lifespan=lifespan, # Use the lifespan context manager
+    default_response_class=ORJSONResponse
 )
 
 # Mount static files
@@ -259,11 +393,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(SecurityHeadersMiddleware)
 
+# CORS Middleware with constant-time origin lookups
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that checks request origins against a frozenset.
+
+    Starlette keeps allow_origins as a list and scans it for every preflight and
+    credentialed request; the set lookup gives the same answer in O(1).
+    """
+    def __init__(self, app, allow_origins=(), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._allowed_origins_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+        return origin in self._allowed_origins_set
+
 # CORS Middleware (should generally be one of the last middlewares)
 # Split the comma-separated string from settings into a list
 cors_origins = [origin.strip() for origin in settings.BACKEND_CORS_ORIGINS.split(',') if origin]
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=cors_origins, # Use the processed list
     allow_credentials=True,
     allow_methods=["*"],
@@ -299,42 +452,47 @@ async def root():
     return {"message": "Welcome to Winning Sales Content Hub API"}
 
 
+# Last successful database ping, shared by healthcheck probes
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache = {"ts": 0.0, "ok": False}
+
+
+def _ping_database() -> bool:
+    """Run `SELECT 1` on a short-lived session and return whether it succeeded."""
+    with Session(engine) as session:
+        result = session.execute(select(1))
+        return result.scalar_one() == 1
+
+
 @app.get("/healthcheck")
-async def healthcheck(session: Session = Depends(get_session)):
+async def healthcheck():
     """
     Healthcheck endpoint that verifies database connection.
 
-    Args:
-        session: Database session dependency
+    A successful ping is cached for about a second so frequent probes are
+    answered from memory instead of checking out a DB connection each time.
 
     Returns:
         dict: Status message
     """
-    # Simple query to verify database connection
+    now = time.monotonic()
+    if _health_cache["ok"] and now - _health_cache["ts"] < _HEALTH_CACHE_TTL_SECONDS:
+        return {"status": "healthy", "database": "connected"}
+
+    # Simple query to verify database connection, off the event loop
     try:
-        # Use a more specific query that doesn't rely on exceptions for flow control
-        result = session.execute(select(1))
-        if result.scalar_one() == 1:
-             return {"status": "healthy", "database": "connected"}
-        else:
-             # This case should ideally not happen with 'SELECT 1'
-             return {"status": "unhealthy", "database": "query failed"}
+        ok = await run_in_threadpool(_ping_database)
     except Exception as e:
+        _health_cache["ok"] = False
         logger.error(f"Healthcheck database connection error: {e}")
         return {"status": "unhealthy", "database": "connection error"}
 
-@app.get("/test-publish")
-async def test_publish():
-    """
-    Test endpoint to manually trigger the LinkedIn post publishing job.
-    """
-    try:
-        logger.info("Manually triggering LinkedIn post publishing job...")
-        publish_scheduled_linkedin_posts()
-        return {"status": "success", "message": "Publishing job triggered"}
-    except Exception as e:
-        logger.error(f"Error triggering publishing job: {e}", exc_info=True)
-        return {"status": "error", "message": str(e)}
+    _health_cache["ok"] = ok
+    _health_cache["ts"] = now
+    if ok:
+        return {"status": "healthy", "database": "connected"}
+    # This case should ideally not happen with 'SELECT 1'
+    return {"status": "unhealthy", "database": "query failed"}
 
 
 if __name__ == "__main__":
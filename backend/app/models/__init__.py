@@ -3,7 +3,9 @@ Models package.
 
 This package contains SQLModel models for the application.
 """
-from app.models.base import BaseModel, TimestampMixin
+from sqlalchemy.orm import configure_mappers
+
+from app.models.base import BaseModel, JSONBList, TimestampMixin, TrustedReadMixin
 from app.models.user import User, UserCreate, UserRead, UserUpdate, UserRole
 from app.models.client import (
     ClientProfile,
@@ -24,10 +26,45 @@ from app.models.content import (
     ContentPieceUpdate,
     ContentStatus,
 )
+from app.models.scheduled_post import (
+    PostStatus,
+    ScheduledLinkedInPost,
+    ScheduledLinkedInPostCreate,
+    ScheduledLinkedInPostRead,
+    ScheduledLinkedInPostUpdate,
+)
+
+# Table models, in dependency order
+__all_models__ = (User, ClientProfile, Strategy, ContentPiece, ScheduledLinkedInPost)
+
+# Resolve the Relationship forward references once, now that every model is
+# imported, so request handlers never trigger a schema rebuild.
+for _model in __all_models__:
+    _model.model_rebuild()
+del _model
+
+
+def warmup() -> None:
+    """
+    Finish lazy model setup before the first request.
+
+    Configures the SQLAlchemy mappers (normally done on first query) and makes
+    sure every table model's pydantic schema, and every deferred input
+    schema, is complete.
+    """
+    configure_mappers()
+    for model in __all_models__:
+        model.model_rebuild()
+    # Input schemas declared with defer_build=True
+    for schema in (UserCreate, UserUpdate):
+        schema.model_rebuild()
+
 
 __all__ = [
     "BaseModel", 
+    "JSONBList",
     "TimestampMixin",
+    "TrustedReadMixin",
     "User",
     "UserCreate",
     "UserRead",
@@ -46,4 +83,10 @@ __all__ = [
     "ContentPieceRead",
     "ContentPieceUpdate",
     "ContentStatus",
+    "PostStatus",
+    "ScheduledLinkedInPost",
+    "ScheduledLinkedInPostCreate",
+    "ScheduledLinkedInPostRead",
+    "ScheduledLinkedInPostUpdate",
+    "warmup",
 ]
@@ -0,0 +1,71 @@
+"""
+msgspec mirrors of the list-endpoint Read schemas.
+
+These are used only to encode outbound JSON for list responses. msgspec is an
+optional dependency: when it is not installed HAS_MSGSPEC is False and the
+endpoints fall back to the pydantic Read schemas.
+"""
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Dict, List, Optional
+
+from app.models.content import ContentStatus
+from app.models.scheduled_post import PostStatus
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+HAS_MSGSPEC = msgspec is not None
+
+
+if HAS_MSGSPEC:
+
+    class ContentPieceReadMsg(msgspec.Struct, frozen=True):
+        """
+        Mirror of ContentPieceRead.
+        """
+        id: int
+        client_id: int
+        title: str
+        idea: str
+        angle: str
+        content_body: str
+        status: ContentStatus
+        due_date: Optional[datetime]
+        scheduled_at: Optional[datetime]
+        review_comment: Optional[str]
+        client_rating: Optional[float]
+        is_active: bool
+        attachments: Optional[List[str]]
+        published_at: Optional[datetime]
+        created_at: datetime
+        updated_at: Optional[datetime]
+
+    class ScheduledLinkedInPostReadMsg(msgspec.Struct, frozen=True):
+        """
+        Mirror of ScheduledLinkedInPostRead.
+        """
+        id: int
+        user_id: int
+        content_id: Optional[int]
+        content_text: str
+        scheduled_at: datetime
+        status: PostStatus
+        linkedin_post_id: Optional[str]
+        error_message: Optional[str]
+        retry_count: int
+        media_assets: Optional[List[Dict[str, Any]]]
+        created_at: datetime
+        updated_at: Optional[datetime]
+
+    def encode_rows(struct, rows) -> bytes:
+        """
+        Encode ORM rows as a JSON array of struct objects.
+
+        Rows come from the database and are trusted, so each struct is built
+        positionally from the row attributes without validation.
+        """
+        get_values = attrgetter(*struct.__struct_fields__)
+        return msgspec.json.encode([struct(*get_values(row)) for row in rows])
@@ -4,16 +4,85 @@ Base models module.
 This module contains base models and mixins used across the application.
 """
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
+
+import orjson
 from sqlmodel import Field, SQLModel
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONBList(TypeDecorator):
+    """
+    JSONB column holding a list.
+
+    Legacy rows that stored the list as an encoded JSON string are decoded
+    with orjson once, at result processing time.
+    """
+    impl = JSONB
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, list):
+            return value
+        return orjson.loads(value) if isinstance(value, (bytes, str)) else value
 
 
 class TimestampMixin(SQLModel):
     """
     Mixin that adds created_at and updated_at fields to a model.
+
+    Both timestamps are filled in by the database (server default / on update).
+    eager_defaults fetches them with INSERT/UPDATE ... RETURNING, so flushed
+    rows have them without a separate refresh.
     """
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    updated_at: Optional[datetime] = Field(default=None, index=True)
+    __mapper_args__ = {"eager_defaults": True}
+
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+        index=True,
+    )
+    updated_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"onupdate": func.now()},
+        index=True,
+    )
+
+
+class TrustedReadMixin:
+    """
+    Mixin for *Read schemas that are built straight from ORM rows.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """
+        Build the schema from an ORM object without re-validating it.
+
+        Trusted DB source only: the row was validated on the way in and is
+        already typed, so pydantic validation is skipped via model_construct.
+        """
+        return cls.model_construct(**{k: getattr(obj, k) for k in cls.model_fields})
+
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Build the schema for every ORM object in rows, as from_orm_fast does.
+
+        The field names and their attrgetter are looked up once for the whole
+        batch instead of once per row.
+        """
+        fields = tuple(cls.model_fields)
+        get_values = attrgetter(*fields)
+        construct = cls.model_construct
+        return [construct(**dict(zip(fields, get_values(row)))) for row in rows]
 
 
 class BaseModel(SQLModel):
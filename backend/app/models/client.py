@@ -3,19 +3,24 @@ Client model module.
 
 This module contains the ClientProfile model and related schemas.
 """
+import re
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime
 
-from pydantic import validator, EmailStr # Remove HttpUrl import
+from pydantic import ConfigDict, field_validator # Remove HttpUrl import
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlmodel import Field, SQLModel, Relationship
 
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, TrustedReadMixin
 from app.models.user import User
 
 if TYPE_CHECKING:
     from app.models.strategy import Strategy
     from app.models.content import ContentPiece
 
+# Shape check only (local@domain.tld); admin-entered addresses need no full RFC parse
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class ClientProfileBase(SQLModel):
     """
@@ -24,7 +29,8 @@ class ClientProfileBase(SQLModel):
     company_name: str = Field(index=True)
     industry: str
     website: Optional[str] = None # Revert to str
-    linkedin_url: Optional[str] = None # Revert to str
+    # CITEXT so case-insensitive lookups can use the index without lower()
+    linkedin_url: Optional[str] = Field(default=None, sa_type=CITEXT, index=True)
     description: Optional[str] = None
     logo_url: Optional[str] = None # Revert to str
     is_active: bool = Field(default=True)
@@ -52,26 +58,35 @@ class ClientProfileCreate(ClientProfileBase):
     Includes user details needed for user creation.
     """
     # User details needed for creation
-    email: EmailStr 
+    email: str
     password: str 
     full_name: Optional[str] = None
     
     # No user_id here, it's generated during creation.
-    # Remove the old validator for user_id
-    # @validator("user_id")
-    def user_must_exist(cls, v, values, **kwargs):
+
+    @field_validator("email")
+    @classmethod
+    def email_must_be_valid(cls, v):
         """
-        Validate that the user exists and has the CLIENT role.
-        
-        Note: This validation is performed at the API level, not here.
+        Validate the email address shape with a precompiled regex.
         """
+        if not _EMAIL_RE.match(v):
+            raise ValueError("value is not a valid email address")
         return v
 
 
-class ClientProfileRead(ClientProfileBase, BaseModel):
+class ClientProfileRead(ClientProfileBase, BaseModel, TrustedReadMixin):
     """
     Schema for reading client profile data.
     """
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+        from_attributes=True,
+        defer_build=False,
+    )
+
     user_id: int
 
 
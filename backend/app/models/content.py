@@ -6,13 +6,14 @@ This module contains the ContentPiece model and related schemas.
 from typing import Optional, List, TYPE_CHECKING, Dict, Any
 from datetime import date, datetime, timezone
 from enum import Enum, auto
+import time
 
-from pydantic import validator
+from pydantic import ConfigDict, field_validator, validator
 from sqlmodel import Field, SQLModel, Relationship, Column, Float, TEXT, JSON
-from sqlalchemy import DateTime
+from sqlalchemy import DateTime, Enum as SAEnum, Index
 from sqlalchemy.dialects.postgresql import JSONB
 
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, JSONBList, TimestampMixin, TrustedReadMixin
 
 if TYPE_CHECKING:
     from app.models.client import ClientProfile
@@ -30,30 +31,67 @@ class ContentStatus(str, Enum):
     PUBLISHED = "PUBLISHED"
 
 
+# O(1) name -> member lookup for status coercion
+_CONTENT_STATUS_BY_NAME = {s.name: s for s in ContentStatus}
+
+# [today, time.monotonic() when it was read]; refreshed at most once a minute
+_TODAY_CACHE = [date.today(), time.monotonic()]
+
+
+def _today() -> date:
+    """
+    Return today's date, re-reading the clock only when the cache is over 60s old.
+    """
+    now = time.monotonic()
+    if now - _TODAY_CACHE[1] > 60:
+        _TODAY_CACHE[0] = date.today()
+        _TODAY_CACHE[1] = now
+    return _TODAY_CACHE[0]
+
+
+def _check_due_date(v):
+    """
+    Raise if the due date (a date or datetime) is before today.
+    """
+    if v and (v.date() if isinstance(v, datetime) else v) < _today():
+        raise ValueError("Due date must be in the future")
+    return v
+
+
 class ContentPieceBase(SQLModel):
     """
     Base model for ContentPiece with common fields.
     """
-    client_id: int = Field(foreign_key="client.id", index=True)
     title: str
     idea: str = Field(default="")
     angle: str = Field(default="")
-    content_body: str = Field(sa_type=TEXT)
-    status: ContentStatus = Field(default=ContentStatus.DRAFT, index=True)
+    # SET STORAGE EXTERNAL (migration 2b7e9d1f5c38): long bodies live out of line in TOAST
+    content_body: str = Field(sa_type=TEXT, sa_column_kwargs={"info": {"storage": "EXTERNAL"}})
+    status: ContentStatus = Field(default=ContentStatus.DRAFT, sa_type=SAEnum(ContentStatus, name="contentstatus"))
     due_date: Optional[datetime] = Field(default=None, index=True)
-    scheduled_at: Optional[datetime] = Field(default=None, index=True)
+    scheduled_at: Optional[datetime] = Field(default=None)
     review_comment: Optional[str] = Field(default=None)
     client_rating: Optional[float] = Field(default=None)
     is_active: bool = Field(default=True)
     attachments: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Convert scheduled_at to UTC if it has timezone info
-        if self.scheduled_at and self.scheduled_at.tzinfo is not None:
-            self.scheduled_at = self.scheduled_at.astimezone(timezone.utc)
-        elif self.scheduled_at:
-            self.scheduled_at = self.scheduled_at.replace(tzinfo=timezone.utc)
+    @field_validator("status", mode="before")
+    @classmethod
+    def _resolve_status(cls, v):
+        """
+        Map a status name straight to its enum member.
+        """
+        return _CONTENT_STATUS_BY_NAME.get(v, v) if isinstance(v, str) else v
+
+    @field_validator("scheduled_at", mode="after")
+    @classmethod
+    def _to_utc(cls, v):
+        """
+        Normalize scheduled_at to UTC; naive values are taken as UTC.
+        """
+        if v is None:
+            return v
+        return v.astimezone(timezone.utc) if v.tzinfo else v.replace(tzinfo=timezone.utc)
 
 
 class ContentPiece(BaseModel, ContentPieceBase, TimestampMixin, table=True):
@@ -62,39 +100,26 @@ class ContentPiece(BaseModel, ContentPieceBase, TimestampMixin, table=True):
     
     This model represents a content piece in the system, which is linked to a client profile.
     """
+    __table_args__ = (
+        # Serves status filters and status + scheduled_at range scans alike.
+        Index("ix_contentpiece_status_scheduled_at", "status", "scheduled_at"),
+    )
+
     # Foreign key to ClientProfile
-    client_id: int = Field(foreign_key="clientprofile.id")
+    client_id: int = Field(foreign_key="clientprofile.id", index=True)
     
     # Optional published timestamp
     published_at: Optional[datetime] = Field(default=None, sa_column=Column(DateTime(timezone=True)))
     
     # Attachments field
-    attachments: Optional[List[str]] = Field(default=None, sa_column=Column(JSONB))
+    attachments: Optional[List[str]] = Field(default=None, sa_column=Column(JSONBList))
     
     # LinkedIn media assets
-    linkedin_media_assets: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB))
+    linkedin_media_assets: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONBList))
     
     # Relationships
     client_profile: "ClientProfile" = Relationship(back_populates="content_pieces")
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Convert attachments to list if it's a string
-        if isinstance(self.attachments, str):
-            try:
-                import json
-                self.attachments = json.loads(self.attachments)
-            except:
-                self.attachments = [self.attachments]
-        
-        # Convert linkedin_media_assets to list if it's a string
-        if isinstance(self.linkedin_media_assets, str):
-            try:
-                import json
-                self.linkedin_media_assets = json.loads(self.linkedin_media_assets)
-            except:
-                self.linkedin_media_assets = [self.linkedin_media_assets]
-
 
 class ContentPieceCreate(ContentPieceBase):
     """
@@ -103,20 +128,27 @@ class ContentPieceCreate(ContentPieceBase):
     client_id: int
     attachments: Optional[List[str]] = None
     
-    @validator("due_date")
+    @field_validator("due_date", mode="after")
+    @classmethod
     def due_date_must_be_future(cls, v):
         """
         Validate that the due date is in the future.
         """
-        if v and v < date.today():
-            raise ValueError("Due date must be in the future")
-        return v
+        return _check_due_date(v)
 
 
-class ContentPieceRead(ContentPieceBase, BaseModel):
+class ContentPieceRead(ContentPieceBase, BaseModel, TrustedReadMixin):
     """
     Schema for reading content piece data.
     """
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+        from_attributes=True,
+        defer_build=False,
+    )
+
     id: int
     client_id: int
     review_comment: Optional[str] = None
@@ -127,11 +159,6 @@ class ContentPieceRead(ContentPieceBase, BaseModel):
     scheduled_at: Optional[datetime] = None
     attachments: Optional[List[str]] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.strftime("%Y-%m-%d %H:%M:%S") if v else None
-        }
-
     @validator('attachments', pre=True)
     def parse_attachments(cls, v):
         if isinstance(v, str):
@@ -159,11 +186,10 @@ class ContentPieceUpdate(SQLModel):
     scheduled_at: Optional[datetime] = None
     attachments: Optional[List[str]] = None
     
-    @validator("due_date")
+    @field_validator("due_date", mode="after")
+    @classmethod
     def due_date_must_be_future(cls, v):
         """
         Validate that the due date is in the future.
         """
-        if v and v < date.today():
-            raise ValueError("Due date must be in the future")
-        return v
+        return _check_due_date(v)
@@ -5,11 +5,13 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, List, Dict, Any
 
+from pydantic import ConfigDict, field_validator
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, DateTime, Enum as SAEnum, Index, String, text
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
 
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, TrustedReadMixin
 # Import User model for relationship typing, avoid circular import if needed
 # from app.models.user import User
 
@@ -24,6 +26,10 @@ class PostStatus(str, Enum):
     DELETED = "deleted"
 
 
+# O(1) name -> member lookup for status coercion
+_POST_STATUS_BY_NAME = {s.name: s for s in PostStatus}
+
+
 class ScheduledLinkedInPostBase(SQLModel):
     """
     Base model for ScheduledLinkedInPost with common fields.
@@ -31,30 +37,75 @@ class ScheduledLinkedInPostBase(SQLModel):
     user_id: int = Field(foreign_key="user.id", index=True)
     content_id: Optional[int] = Field(default=None, foreign_key="contentpiece.id", index=True) # Link to content if exists
     # Correctly specify TEXT type using sa_type
-    content_text: str = Field(sa_type=TEXT)
-    scheduled_at: datetime = Field(index=True)
-    status: PostStatus = Field(default=PostStatus.PENDING, index=True)
-    linkedin_post_id: Optional[str] = Field(default=None, index=True) # Store the ID returned by LinkedIn API
+    # SET STORAGE EXTERNAL (migration 2b7e9d1f5c38): long texts live out of line in TOAST
+    content_text: str = Field(sa_type=TEXT, sa_column_kwargs={"info": {"storage": "EXTERNAL"}})
+    scheduled_at: datetime = Field(sa_type=DateTime(timezone=True))
+    status: PostStatus = Field(default=PostStatus.PENDING, sa_type=SAEnum(PostStatus, name="poststatus"))
+    # Store the ID (URN) returned by LinkedIn API; URNs are short, so bound the column
+    linkedin_post_id: Optional[str] = Field(default=None, sa_type=String(128))
     error_message: Optional[str] = Field(default=None)
     retry_count: int = Field(default=0) # Added retry counter
     media_assets: Optional[List[Dict[str, Any]]] = Field(default=None, sa_column=Column(JSONB)) # Store LinkedIn media asset objects
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Convert scheduled_at to UTC if it has timezone info
-        if self.scheduled_at and self.scheduled_at.tzinfo is not None:
-            self.scheduled_at = self.scheduled_at.astimezone(timezone.utc)
-        elif self.scheduled_at:
-            self.scheduled_at = self.scheduled_at.replace(tzinfo=timezone.utc)
+    @field_validator("status", mode="before")
+    @classmethod
+    def _resolve_status(cls, v):
+        """
+        Map a status name straight to its enum member.
+        """
+        return _POST_STATUS_BY_NAME.get(v, v) if isinstance(v, str) else v
+
+    @field_validator("scheduled_at", mode="after")
+    @classmethod
+    def _to_utc(cls, v):
+        """
+        Normalize scheduled_at to UTC; naive values are taken as UTC.
+        """
+        if v is None:
+            return v
+        return v.astimezone(timezone.utc) if v.tzinfo else v.replace(tzinfo=timezone.utc)
 
 
 class ScheduledLinkedInPost(BaseModel, ScheduledLinkedInPostBase, TimestampMixin, table=True):
     """
     Database model for a scheduled LinkedIn post.
     """
+    __table_args__ = (
+        # Partial index matching the scheduler's polling predicate
+        # (status = PENDING AND scheduled_at <= now); excludes finished posts.
+        # It stands in for separate status/scheduled_at indexes.
+        Index(
+            "ix_scheduledlinkedinpost_pending_due",
+            "scheduled_at",
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # Only published posts have a LinkedIn ID; leave the NULLs out of the index
+        Index(
+            "ix_scheduledlinkedinpost_linkedin_post_id",
+            "linkedin_post_id",
+            unique=True,
+            postgresql_where=text("linkedin_post_id IS NOT NULL"),
+        ),
+        # Rows are appended in created_at order, so a BRIN index answers
+        # created_at range scans at a fraction of a B-tree's size.
+        Index(
+            "ix_scheduledlinkedinpost_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+
+    # Same column as TimestampMixin.created_at, minus its B-tree index (see BRIN above)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()},
+        nullable=False,
+    )
+
     # Define relationship if needed (e.g., to access user details from post)
     # user: "User" = Relationship(back_populates="scheduled_posts") # Add scheduled_posts to User model if needed
-    pass
 
 
 class ScheduledLinkedInPostCreate(ScheduledLinkedInPostBase):
@@ -68,12 +119,18 @@ class ScheduledLinkedInPostCreate(ScheduledLinkedInPostBase):
     pass
 
 
-class ScheduledLinkedInPostRead(ScheduledLinkedInPostBase, BaseModel, TimestampMixin):
+class ScheduledLinkedInPostRead(ScheduledLinkedInPostBase, BaseModel, TimestampMixin, TrustedReadMixin):
     """
     Schema for reading scheduled post data via API.
     Includes all fields including generated ones like id, created_at etc.
     """
-    pass
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+        from_attributes=True,
+        defer_build=False,
+    )
 
 
 class ScheduledLinkedInPostUpdate(SQLModel):
@@ -6,9 +6,10 @@ This module contains the Strategy model and related schemas.
 from typing import Optional, TYPE_CHECKING
 from datetime import datetime
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel, Relationship
 
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, TrustedReadMixin
 
 if TYPE_CHECKING:
     from app.models.client import ClientProfile
@@ -45,10 +46,18 @@ class StrategyCreate(StrategyBase):
     client_id: int
 
 
-class StrategyRead(StrategyBase, BaseModel):
+class StrategyRead(StrategyBase, BaseModel, TrustedReadMixin):
     """
     Schema for reading strategy data.
     """
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+        from_attributes=True,
+        defer_build=False,
+    )
+
     client_id: int
 
 
@@ -5,13 +5,13 @@ This module contains the User model and related schemas.
 """
 from datetime import datetime
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
-from pydantic import EmailStr, validator, computed_field # Import computed_field
+from pydantic import ConfigDict, EmailStr, computed_field
 from sqlmodel import Field, SQLModel, Relationship
-from sqlalchemy import String # Import String type
+from sqlalchemy import Index, String # Import String type
 
-from app.models.base import BaseModel, TimestampMixin
+from app.models.base import BaseModel, TimestampMixin, TrustedReadMixin
 
 if TYPE_CHECKING:
     from app.models.client import ClientProfile
@@ -43,6 +43,16 @@ class User(BaseModel, UserBase, TimestampMixin, table=True):
     This model represents a user in the system, which can be either an admin
     or a client. Includes fields for LinkedIn integration.
     """
+    __table_args__ = (
+        # Covering index for login: lets the email lookup be answered by an
+        # index-only scan without fetching the heap row.
+        Index(
+            "ix_user_login_cover",
+            "email",
+            postgresql_include=["hashed_password", "is_active", "role", "id"],
+        ),
+    )
+
     hashed_password: str
     last_login: Optional[datetime] = Field(default=None)
 
@@ -60,62 +70,50 @@ class UserCreate(UserBase):
     """
     Schema for creating a new user.
     """
-    password: str
+    model_config = ConfigDict(defer_build=True)
 
-    @validator("password")
-    def password_min_length(cls, v):
-        """
-        Validate that password meets minimum length requirement.
-        """
-        if len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        return v
+    password: str = Field(min_length=8, description="At least 8 characters")
 
 
-class UserRead(UserBase, BaseModel):
+class UserRead(UserBase, BaseModel, TrustedReadMixin):
     """
     Schema for reading user data, including LinkedIn ID and client_id.
     Excludes sensitive fields like password and access token.
     """
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        extra="ignore",
+        from_attributes=True,
+        defer_build=False,
+    )
+
     # Inherits id, created_at, updated_at from BaseModel
     # Inherits email, full_name, role, is_active from UserBase
     last_login: Optional[datetime] = None
     linkedin_id: Optional[str] = None
     # Do NOT include linkedin_access_token or linkedin_token_expires_at here for security
 
-    # Add client_id derived from the relationship
-    # This requires the client_profile relationship to be loaded when fetching the user
-    # for the /users/me endpoint. Ensure the dependency loader handles this.
-    client_id: Optional[int] = None # Add the field
-
-    # If using Pydantic v2 and SQLModel >= 0.0.14, computed_field is preferred
-    # @computed_field
-    # @property
-    # def client_id(self) -> Optional[int]:
-    #     if self.client_profile:
-    #         return self.client_profile.id
-    #     return None
+    # The user's ClientProfile row, read from the relationship (load it with
+    # selectinload/joinedload for lists). Only used to derive client_id below.
+    client_profile: Optional[Any] = Field(default=None, exclude=True)
 
-    # For older versions or simpler approach, we might need to populate this manually
-    # in the endpoint if the relationship isn't automatically loaded/serialized.
-    # However, SQLModel often handles this if the relationship is defined.
-    # Let's add the field first and see if it populates automatically.
+    @computed_field
+    @property
+    def client_id(self) -> Optional[int]:
+        """
+        ID of the user's client profile, if any.
+        """
+        return self.client_profile.id if self.client_profile else None
 
 
 class UserUpdate(SQLModel):
     """
     Schema for updating a user.
     """
+    model_config = ConfigDict(defer_build=True)
+
     full_name: Optional[str] = None
     email: Optional[EmailStr] = None
     is_active: Optional[bool] = None
-    password: Optional[str] = None
-
-    @validator("password")
-    def password_min_length(cls, v):
-        """
-        Validate that password meets minimum length requirement.
-        """
-        if v is not None and len(v) < 8:
-            raise ValueError("Password must be at least 8 characters long")
-        return v
+    password: Optional[str] = Field(default=None, min_length=8, description="At least 8 characters")
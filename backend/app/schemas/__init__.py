@@ -3,6 +3,31 @@ Schemas package.
 
 This package contains Pydantic schemas for API requests and responses.
 """
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.models.user import UserRead
 from app.schemas.token import Token, TokenData, TokenPayload
 
-__all__ = ["Token", "TokenData", "TokenPayload"]
+# Built once at import; serializes straight to JSON bytes in pydantic-core
+USER_READ_ADAPTER = TypeAdapter(UserRead)
+USER_READ_LIST_ADAPTER = TypeAdapter(List[UserRead])
+
+
+def warmup() -> None:
+    """
+    Build the deferred token schemas before the first request.
+    """
+    for schema in (Token, TokenData, TokenPayload):
+        schema.model_rebuild()
+
+
+__all__ = [
+    "Token",
+    "TokenData",
+    "TokenPayload",
+    "USER_READ_ADAPTER",
+    "USER_READ_LIST_ADAPTER",
+    "warmup",
+]
@@ -3,9 +3,7 @@ Token schemas module.
 
 This module contains schemas for authentication tokens.
 """
-from typing import Optional
-
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.models.user import UserRole
 
@@ -14,6 +12,8 @@ class Token(BaseModel):
     """
     Schema for access token.
     """
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str
     token_type: str = "bearer"
 
@@ -21,14 +21,20 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     """
     Schema for token payload.
+
+    Both claims are required: a token without them fails validation.
     """
-    sub: Optional[int] = None
-    exp: Optional[int] = None
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
+    sub: int
+    exp: int
 
 
 class TokenData(BaseModel):
     """
     Schema for token data.
     """
+    model_config = ConfigDict(defer_build=True)
+
     user_id: int
     role: UserRole
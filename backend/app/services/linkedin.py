@@ -4,16 +4,39 @@ LinkedIn service module.
 This module contains functions for interacting with LinkedIn API.
 """
 import logging
-import requests
-from typing import Optional
+
+import aiofiles
+import httpx
+import orjson
+from typing import AsyncIterator, Optional
 from fastapi import HTTPException, status
 
 from app.core.config import settings
 from app.core.security import decrypt_data
 from app.models.user import User
+from app.services import linkedin_http
+from app.utils.file_utils import CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
+_REGISTER_UPLOAD_URL = "https://api.linkedin.com/v2/assets?action=registerUpload"
+# Static parts of the registerUpload request; only the token and owner vary per call
+_STATIC_HEADERS = {
+    "Content-Type": "application/json",
+    "X-Restli-Protocol-Version": "2.0.0",
+}
+_REGISTER_TMPL = {
+    "registerUploadRequest": {
+        "recipes": ["urn:li:digitalmediaRecipe:feedshare-image"],
+        "serviceRelationships": [
+            {
+                "relationshipType": "OWNER",
+                "identifier": "urn:li:userGeneratedContent"
+            }
+        ]
+    }
+}
+
 def get_access_token(user: User) -> str:
     """Get LinkedIn access token for user."""
     if not user.linkedin_access_token:
@@ -23,76 +46,76 @@ def get_access_token(user: User) -> str:
         )
     return decrypt_data(user.linkedin_access_token)
 
-def register_upload(access_token: str, user_id: str) -> dict:
+async def register_upload(access_token: str, user_id: str) -> dict:
     """Register a file upload with LinkedIn."""
-    url = "https://api.linkedin.com/v2/assets?action=registerUpload"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Content-Type": "application/json",
-        "X-Restli-Protocol-Version": "2.0.0"
-    }
-    
+    headers = {**_STATIC_HEADERS, "Authorization": f"Bearer {access_token}"}
     data = {
         "registerUploadRequest": {
-            "recipes": ["urn:li:digitalmediaRecipe:feedshare-image"],
+            **_REGISTER_TMPL["registerUploadRequest"],
             "owner": f"urn:li:person:{user_id}",
-            "serviceRelationships": [
-                {
-                    "relationshipType": "OWNER",
-                    "identifier": "urn:li:userGeneratedContent"
-                }
-            ]
         }
     }
     
     try:
-        response = requests.post(url, headers=headers, json=data)
+        response = await linkedin_http.client.post(_REGISTER_UPLOAD_URL, headers=headers, content=orjson.dumps(data))
         response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"LinkedIn API error: {str(e)}")
+        return orjson.loads(response.content)
+    except httpx.HTTPError as e:
+        logger.error("LinkedIn API error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"LinkedIn API error: {str(e)}"
         )
 
-def upload_file(upload_url: str, file_path: str, content_type: str) -> None:
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+def _sniff_mime(file_path: str) -> str:
+    """Detect the image content type from the file's magic bytes."""
+    with open(file_path, 'rb') as f:
+        head = f.read(8)
+    return "image/png" if head.startswith(_PNG_SIGNATURE) else "image/jpeg"
+
+async def _iter_file(file_path: str) -> AsyncIterator[bytes]:
+    """Yield the file in CHUNK_SIZE pieces without blocking the event loop."""
+    async with aiofiles.open(file_path, 'rb') as f:
+        while chunk := await f.read(CHUNK_SIZE):
+            yield chunk
+
+async def upload_file(upload_url: str, file_path: str, content_type: str) -> None:
     """Upload a file to LinkedIn."""
     try:
-        with open(file_path, 'rb') as f:
-            file_content = f.read()
-        
         headers = {
             "Content-Type": content_type
         }
         
-        response = requests.put(upload_url, headers=headers, data=file_content)
+        # Stream the file from disk rather than holding the whole image in memory
+        response = await linkedin_http.client.put(upload_url, headers=headers, content=_iter_file(file_path))
         response.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        logger.error(f"LinkedIn API error: {str(e)}")
+    except httpx.HTTPError as e:
+        logger.error("LinkedIn API error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"LinkedIn API error: {str(e)}"
         )
 
-def upload_to_linkedin(file_path: str, user: User) -> str:
+async def upload_to_linkedin(file_path: str, user: User) -> str:
     """Upload a file to LinkedIn and return the asset URN."""
     try:
         # Get access token
         access_token = get_access_token(user)
         
         # Register upload
-        upload_info = register_upload(access_token, user.linkedin_id)
+        upload_info = await register_upload(access_token, user.linkedin_id)
         upload_url = upload_info["value"]["uploadMechanism"]["com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest"]["uploadUrl"]
         asset = upload_info["value"]["asset"]
         
         # Upload file
-        upload_file(upload_url, file_path, "image/jpeg")  # or "image/png" based on file type
+        await upload_file(upload_url, file_path, _sniff_mime(file_path))
         
         return f"urn:li:digitalmediaAsset:{asset}"
     except Exception as e:
-        logger.error(f"Failed to upload file to LinkedIn: {str(e)}")
+        logger.error("Failed to upload file to LinkedIn: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Failed to upload file to LinkedIn: {str(e)}"
-        ) 
\ No newline at end of file
+        )
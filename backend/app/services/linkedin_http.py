@@ -0,0 +1,20 @@
+"""
+Shared LinkedIn HTTP client module.
+
+Every call to LinkedIn (OAuth endpoints, media uploads and the publishing
+job) goes through this one pooled client, so keep-alive TLS connections to
+linkedin.com are reused and no request blocks the event loop.
+"""
+import httpx
+
+# Callers go through linkedin_http.client rather than a from-import so tests
+# can swap it. Closed from the application lifespan via aclose().
+client = httpx.AsyncClient(
+    timeout=30,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+)
+
+
+async def aclose() -> None:
+    """Close the shared LinkedIn HTTP client (called on application shutdown)."""
+    await client.aclose()
@@ -1,42 +1,47 @@
+import asyncio
 import os
 import logging
 from fastapi import UploadFile, HTTPException
 from typing import List
 
+import aiofiles
+
 logger = logging.getLogger(__name__)
 
-ALLOWED_EXTENSIONS = {'.jpg', '.jpeg', '.png'}
+ALLOWED_EXTENSIONS = frozenset({'jpg', 'jpeg', 'png'})
+_EXTENSION_ERROR = f"File type not allowed. Allowed types: {', '.join('.' + ext for ext in sorted(ALLOWED_EXTENSIONS))}"
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+CHUNK_SIZE = 64 * 1024  # Bytes read/written per step when saving uploads
 
 def validate_file(file: UploadFile) -> None:
     """Validate file type and size."""
-    # Check file extension
-    ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(status_code=400, detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}")
+    # Check file extension (like splitext, "name" and ".png" have none)
+    stem, _, ext = (file.filename or "").rpartition('.')
+    if not stem or ext.lower() not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail=_EXTENSION_ERROR)
     
     # Check file size
     if file.size > MAX_FILE_SIZE:
         raise HTTPException(status_code=400, detail=f"File size exceeds {MAX_FILE_SIZE/1024/1024}MB limit")
 
 async def save_upload_file(file: UploadFile, destination: str) -> None:
-    """Save uploaded file to destination."""
+    """Save uploaded file to destination, streaming it in CHUNK_SIZE pieces."""
+    # Validate file before touching disk; a rejected file stays a 400
+    validate_file(file)
+
     try:
-        # Validate file
-        validate_file(file)
-        
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        await asyncio.to_thread(os.makedirs, os.path.dirname(destination), exist_ok=True)
         
-        # Save file
-        content = await file.read()
-        with open(destination, "wb") as f:
-            f.write(content)
+        # Save file without buffering all of it or blocking the event loop
+        async with aiofiles.open(destination, "wb") as out:
+            while chunk := await file.read(CHUNK_SIZE):
+                await out.write(chunk)
             
         # Reset file pointer
         await file.seek(0)
     except Exception as e:
-        logger.error(f"Error saving file {file.filename}: {str(e)}")
+        logger.error("Error saving file %s: %s", file.filename, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to save file: {str(e)}"
@@ -48,7 +48,7 @@ wait_for_db() {
 # Wait for the database
 wait_for_db
 
-# Run Alembic migrations
+# Run Alembic migrations once per deploy (the app itself no longer creates tables on startup)
 echo "Running database migrations..."
 alembic upgrade head
 
@@ -60,5 +60,10 @@ echo "Initial superuser creation process finished."
 
 # Start the main application (Uvicorn)
 # Use exec to replace the shell process with Uvicorn, allowing it to receive signals correctly
-echo "Starting Uvicorn server..."
-exec uvicorn app.main:app --host 0.0.0.0 --port 8000
+# Only one of the workers starts the publishing scheduler (see app.main lifespan)
+# Defaults to a single worker: OAuth state (app.core.oauth_state_manager) is kept
+# in process memory, so the LinkedIn callback must reach the worker that issued it.
+# Raise this only once the state store is shared between processes.
+WEB_CONCURRENCY=${WEB_CONCURRENCY:-1}
+echo "Starting Uvicorn server with $WEB_CONCURRENCY workers..."
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "$WEB_CONCURRENCY"
@@ -4,7 +4,6 @@ Script to create an admin user in the database.
 Run this script after setting up the database to create the initial admin user.
 """
 
-import asyncio
 import sys
 import os
 from pathlib import Path # Import Path
@@ -27,29 +26,29 @@ else:
 # Now import app modules AFTER potentially loading .env
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
-from app.core.database import get_session
+from app.core.database import SessionLocal
 from sqlmodel import select
-# from sqlmodel.ext.asyncio.session import AsyncSession # Not used
 
 
 def create_admin_user(email: str, password: str):
     """Create an admin user with the given email and password."""
     print("Attempting to get database session...")
-    session = next(get_session())
+    session = SessionLocal()
     print("Database session obtained.")
     try:
         # Check if user already exists
         print(f"Checking if user {email} exists...")
-        result = session.execute(select(User).where(User.email == email))
-        user = result.scalar_one_or_none()
-
-        if user:
+        # Only the primary key is needed to detect an existing user
+        if session.scalar(select(User.id).where(User.email == email)):
             print(f"User with email {email} already exists.")
             return
 
         # Create new admin user
         print(f"Creating user {email}...")
         hashed_password = get_password_hash(password)
+        # Table models skip pydantic validation in __init__, so EmailStr is not
+        # checked here. model_construct() would also skip ORM instrumentation
+        # and the instance could not be added to the session.
         admin_user = User(
             email=email,
             hashed_password=hashed_password,
@@ -59,10 +58,13 @@ def create_admin_user(email: str, password: str):
         )
 
         session.add(admin_user)
+        # The flush assigns the id; read it before commit expires the object
+        # so the print does not reload the whole row.
+        session.flush()
+        admin_user_id = admin_user.id
         session.commit()
-        session.refresh(admin_user)
 
-        print(f"Admin user created successfully with ID: {admin_user.id}")
+        print(f"Admin user created successfully with ID: {admin_user_id}")
     except Exception as e:
         print(f"Error during admin user creation: {e}")
         # Optionally re-raise the exception if needed
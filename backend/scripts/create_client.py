@@ -4,7 +4,6 @@ Script to create a client user and associated client profile in the database.
 Run this script after setting up the database and creating an admin user.
 """
 
-import asyncio
 import sys
 import os
 
@@ -14,25 +13,24 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.models.client import ClientProfile
-from app.core.database import get_session
+from app.core.database import SessionLocal
 from sqlmodel import select
-from sqlmodel.ext.asyncio.session import AsyncSession
 
 
 def create_client_user(email: str, password: str, company_name: str, industry: str, contact_name: str):
     """Create a client user with the given details and an associated client profile."""
-    session = next(get_session())
+    session = SessionLocal()
     try:
         # Check if user already exists
-        result = session.execute(select(User).where(User.email == email))
-        user = result.scalar_one_or_none()
-        
-        if user:
+        # Only the primary key is needed to detect an existing user
+        if session.scalar(select(User.id).where(User.email == email)):
             print(f"User with email {email} already exists.")
             return
         
         # Create new client user
         hashed_password = get_password_hash(password)
+        # Not User.model_construct(): table models are not validated on init
+        # anyway, and constructed instances lack ORM instrumentation.
         client_user = User(
             email=email,
             hashed_password=hashed_password,
@@ -42,8 +40,8 @@ def create_client_user(email: str, password: str, company_name: str, industry: s
         )
         
         session.add(client_user)
-        session.commit()
-        session.refresh(client_user)
+        # The flush assigns the user id without committing or reloading the row
+        session.flush()
         
         # Create client profile
         client_profile = ClientProfile(
@@ -55,11 +53,13 @@ def create_client_user(email: str, password: str, company_name: str, industry: s
         )
         
         session.add(client_profile)
+        session.flush()
+        # Read the ids before commit expires the objects
+        client_user_id, client_profile_id = client_user.id, client_profile.id
         session.commit()
-        session.refresh(client_profile)
         
-        print(f"Client user created successfully with ID: {client_user.id}")
-        print(f"Client profile created successfully with ID: {client_profile.id}")
+        print(f"Client user created successfully with ID: {client_user_id}")
+        print(f"Client profile created successfully with ID: {client_profile_id}")
     finally:
         session.close()
 
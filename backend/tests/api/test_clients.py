@@ -1,13 +1,16 @@
 """
 Tests for client API endpoints.
 """
+import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlalchemy.orm import selectinload
+from sqlmodel import Session, select
 
-from app.core.security import get_password_hash
 from app.crud.client import create as create_client # Import create function
+from app.crud.client import create_many as create_clients
 from app.models.client import ClientProfile, ClientProfileCreate # Import ClientProfile
-from app.models.user import User, UserRole
+from app.models.user import User
+from tests.utils import token_for
 
 
 # Helper function to create a test client profile and user directly
@@ -26,33 +29,18 @@ def create_test_client_via_crud(session: Session, email: str, password: str, com
         # If creation fails (e.g., duplicate email from another test), handle it
         print(f"Warning: Helper function failed to create client {email}: {e}")
         # Attempt to retrieve existing user/profile if creation failed due to duplicate
-        user = session.exec(select(User).where(User.email == email)).first()
+        user = session.exec(
+            select(User).where(User.email == email).options(selectinload(User.client_profile))
+        ).first()
         if user and user.client_profile:
             return user.client_profile
         raise e # Re-raise if it wasn't a duplicate issue or retrieval failed
 
 
-def test_create_client(client: TestClient, session: Session):
+def test_create_client(client: TestClient, session: Session, admin_token: str):
     """
     Test creating a client profile via the API endpoint.
     """
-    # Create an admin user
-    admin_user = User(
-        email="admin_create@example.com", # Use unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Admin User",
-        role=UserRole.ADMIN,
-    )
-    session.add(admin_user)
-    session.commit() # Commit admin user
-
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_create@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
-
     # Create client profile via API
     client_data = {
         "email": "newclient_api@example.com",
@@ -66,7 +54,7 @@ def test_create_client(client: TestClient, session: Session):
     }
     response = client.post(
         "/api/v1/clients/",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {admin_token}"},
         json=client_data,
     )
 
@@ -78,27 +66,10 @@ def test_create_client(client: TestClient, session: Session):
     assert "user_id" in data
 
 
-def test_create_client_not_admin(client: TestClient, session: Session):
+def test_create_client_not_admin(client: TestClient, client_token: str):
     """
     Test creating a client profile as a non-admin user.
     """
-    # Create a client user
-    client_user = User(
-        email="client_auth_test@example.com", # Unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Client User Auth",
-        role=UserRole.CLIENT,
-    )
-    session.add(client_user)
-    session.commit()
-
-    # Login as client
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "client_auth_test@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
-
     # Try to create client profile
     client_data = {
         "email": "anotherclient@example.com",
@@ -109,7 +80,7 @@ def test_create_client_not_admin(client: TestClient, session: Session):
     }
     response = client.post(
         "/api/v1/clients/",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {client_token}"},
         json=client_data,
     )
 
@@ -117,49 +88,35 @@ def test_create_client_not_admin(client: TestClient, session: Session):
     assert response.status_code == 403
 
 
-def test_read_clients(client: TestClient, session: Session):
+def test_read_clients(client: TestClient, session: Session, admin_token: str):
     """
     Test reading all client profiles.
     """
-    # Create an admin user
-    admin_user = User(
-        email="admin_read@example.com", # Unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Admin User Read",
-        role=UserRole.ADMIN,
-    )
-    session.add(admin_user)
-    session.commit()
-
-    # Create client profiles using helper
-    client_profile1 = create_test_client_via_crud(
-        session,
-        email="client_read1@example.com",
-        password="password123",
-        company="Test Company Read 1",
-        industry="Tech Read",
-        full_name="Client Read 1"
-    )
-    client_profile2 = create_test_client_via_crud(
+    # Create both client profiles in one transaction
+    client_profile1, client_profile2 = create_clients(
         session,
-        email="client_read2@example.com",
-        password="password123",
-        company="Test Company Read 2",
-        industry="Finance Read",
-        full_name="Client Read 2"
-    )
-
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_read@example.com", "password": "password123"},
+        objs_in=[
+            ClientProfileCreate(
+                email="client_read1@example.com",
+                password="password123",
+                full_name="Client Read 1",
+                company_name="Test Company Read 1",
+                industry="Tech Read",
+            ),
+            ClientProfileCreate(
+                email="client_read2@example.com",
+                password="password123",
+                full_name="Client Read 2",
+                company_name="Test Company Read 2",
+                industry="Finance Read",
+            ),
+        ],
     )
-    token = login_response.json()["access_token"]
 
     # Get all client profiles
     response = client.get(
         "/api/v1/clients/",
-        headers={"Authorization": f"Bearer {token}"},
+        headers={"Authorization": f"Bearer {admin_token}"},
     )
 
     # Check response
@@ -172,51 +129,6 @@ def test_read_clients(client: TestClient, session: Session):
     assert client_profile2.company_name in company_names
 
 
-def test_read_client(client: TestClient, session: Session):
-    """
-    Test reading a specific client profile.
-    """
-    # Create an admin user
-    admin_user = User(
-        email="admin_read_one@example.com", # Unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Admin User Read One",
-        role=UserRole.ADMIN,
-    )
-    session.add(admin_user)
-    session.commit()
-
-    # Create client profile using helper
-    client_profile = create_test_client_via_crud(
-        session,
-        email="client_read_one@example.com",
-        password="password123",
-        company="Test Company Read One",
-        industry="Tech Read One",
-        full_name="Client Read One"
-    )
-
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_read_one@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
-
-    # Get client profile
-    response = client.get(
-        f"/api/v1/clients/{client_profile.id}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-
-    # Check response
-    assert response.status_code == 200
-    data = response.json()
-    assert data["company_name"] == client_profile.company_name
-    assert data["industry"] == client_profile.industry
-    assert data["user_id"] == client_profile.user_id
-
-
 def test_read_client_me(client: TestClient, session: Session):
     """
     Test reading the current user's client profile.
@@ -231,12 +143,7 @@ def test_read_client_me(client: TestClient, session: Session):
         full_name="Client Read Me"
     )
 
-    # Login as client
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "client_read_me@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    token = token_for(client_profile.user_id)
 
     # Get own client profile
     response = client.get(
@@ -252,100 +159,64 @@ def test_read_client_me(client: TestClient, session: Session):
     assert data["user_id"] == client_profile.user_id
 
 
-def test_update_client(client: TestClient, session: Session):
+@pytest.fixture(name="seeded_profile")
+def seeded_profile_fixture(session: Session) -> ClientProfile:
     """
-    Test updating a client profile.
+    A fresh client profile (and its user) for the by-ID endpoint tests.
     """
-    # Create an admin user
-    admin_user = User(
-        email="admin_update@example.com", # Unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Admin User Update",
-        role=UserRole.ADMIN,
-    )
-    session.add(admin_user)
-    session.commit()
-
-    # Create client profile using helper
-    client_profile = create_test_client_via_crud(
+    return create_test_client_via_crud(
         session,
-        email="client_update@example.com",
+        email="client_seeded@example.com",
         password="password123",
-        company="Test Company Update",
-        industry="Tech Update",
-        full_name="Client Update"
-    )
-
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_update@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
-
-    # Update client profile
-    update_data = {
-        "company_name": "Updated Company",
-        "website": "https://updated-example.com",
-    }
-    response = client.put(
-        f"/api/v1/clients/{client_profile.id}",
-        headers={"Authorization": f"Bearer {token}"},
-        json=update_data,
-    )
-
-    # Check response
-    assert response.status_code == 200
-    data = response.json()
-    assert data["company_name"] == update_data["company_name"]
-    assert data["industry"] == client_profile.industry # Should not change
-    assert data["website"] == update_data["website"]
-
-
-def test_delete_client(client: TestClient, session: Session):
+        company="Test Company Seeded",
+        industry="Tech Seeded",
+        full_name="Client Seeded"
+    )
+
+
+@pytest.mark.parametrize(
+    "method, json_body",
+    [
+        ("GET", None),
+        ("PUT", {"company_name": "Updated Company", "website": "https://updated-example.com"}),
+        ("DELETE", None),
+    ],
+    ids=["read", "update", "delete"],
+)
+def test_client_by_id(
+    method: str,
+    json_body,
+    client: TestClient,
+    session: Session,
+    admin_token: str,
+    seeded_profile: ClientProfile,
+):
     """
-    Test deleting a client profile.
+    Test reading, updating and deleting a specific client profile as admin.
     """
-    # Create an admin user
-    admin_user = User(
-        email="admin_delete@example.com", # Unique email
-        hashed_password=get_password_hash("password123"),
-        full_name="Admin User Delete",
-        role=UserRole.ADMIN,
-    )
-    session.add(admin_user)
-    session.commit()
-
-    # Create client profile using helper
-    client_profile = create_test_client_via_crud(
-        session,
-        email="client_delete@example.com",
-        password="password123",
-        company="Test Company Delete",
-        industry="Tech Delete",
-        full_name="Client Delete"
-    )
-    client_profile_id = client_profile.id # Store ID
-
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_delete@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    client_profile_id = seeded_profile.id # Store ID
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    # Fields the response must carry; an update overrides the ones it sends
+    expected = {
+        "company_name": seeded_profile.company_name,
+        "industry": seeded_profile.industry,
+        "user_id": seeded_profile.user_id,
+        **(json_body or {}),
+    }
 
-    # Delete client profile
-    response = client.delete(
+    response = client.request(
+        method,
         f"/api/v1/clients/{client_profile_id}",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=headers,
+        json=json_body,
     )
 
-    # Check response
-    assert response.status_code == 200 # Endpoint returns 200 OK with deleted object
+    # Check response (DELETE also returns 200 with the deleted object)
+    assert response.status_code == 200
+    data = response.json()
+    for field, value in expected.items():
+        assert data[field] == value
 
-    # Check that client profile is deleted
-    get_response = client.get(
-        f"/api/v1/clients/{client_profile_id}",
-        headers={"Authorization": f"Bearer {token}"},
-    )
-    assert get_response.status_code == 404
+    if method == "DELETE":
+        # Check that client profile is deleted
+        assert session.get(ClientProfile, client_profile_id) is None
@@ -1,17 +1,21 @@
 """
 Tests for content API endpoints.
 """
+from typing import Dict
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, select # Import select
 from datetime import date
 
-from app.core.security import get_password_hash
 from app.crud.client import create as create_client_crud
 from app.crud.content import create as create_content_crud, update_status
 from app.models.client import ClientProfile, ClientProfileCreate # Import ClientProfile
 from app.models.content import ContentPieceCreate, ContentPieceUpdate, ContentStatus, ContentPiece # Import ContentPiece
-from app.models.user import User, UserRole
+from app.models.user import User
+
+# A due date one year out, computed once at import
+_FUTURE_DATE = date.today().replace(year=date.today().year + 1).isoformat()
 
 
 # Helper to create client and user
@@ -55,29 +59,23 @@ def get_auth_token(client: TestClient, email: str, password: str = "password123"
     return login_response.json()["access_token"]
 
 
-def test_create_content(client: TestClient, session: Session):
+def test_create_content(client: TestClient, session: Session, admin_token_headers: Dict[str, str]):
     """
     Test creating content as admin.
     """
-    admin_user = User(email="admin.content@test.com", full_name="Admin Content", hashed_password=get_password_hash("pw"), role=UserRole.ADMIN)
-    session.add(admin_user)
-    session.commit()
-
     test_client_user = create_test_client_with_user(session, "client.content.create@test.com", "Content Create Co")
     assert test_client_user.client_profile is not None, "Client profile not created/linked in helper"
 
-    token = get_auth_token(client, "admin.content@test.com", "pw")
-
     response = client.post(
         "/api/v1/contents/",
-        headers={"Authorization": f"Bearer {token}"},
+        headers=admin_token_headers,
         json={
             "client_id": test_client_user.client_profile.id,
             "title": "API Create Test",
             "idea": "Idea",
             "angle": "Angle",
             "content_body": "Body",
-            "due_date": date.today().replace(year=date.today().year + 1).isoformat()
+            "due_date": _FUTURE_DATE
         },
     )
     assert response.status_code == 200, f"API call failed: {response.text}"
@@ -87,14 +85,10 @@ def test_create_content(client: TestClient, session: Session):
     assert data["status"] == ContentStatus.DRAFT
 
 
-def test_read_contents_admin(client: TestClient, session: Session):
+def test_read_contents_admin(client: TestClient, session: Session, admin_token_headers: Dict[str, str]):
     """
     Test reading all contents as admin.
     """
-    admin_user = User(email="admin.content.read@test.com", full_name="Admin Read", hashed_password=get_password_hash("pw"), role=UserRole.ADMIN)
-    session.add(admin_user)
-    session.commit()
-
     client1 = create_test_client_with_user(session, "c1.content.read@test.com", "Read Co 1")
     client2 = create_test_client_with_user(session, "c2.content.read@test.com", "Read Co 2")
     assert client1.client_profile is not None
@@ -102,8 +96,7 @@ def test_read_contents_admin(client: TestClient, session: Session):
     create_content_crud(session, obj_in=ContentPieceCreate(client_id=client1.client_profile.id, title="C1 Read", idea="i", angle="a", content_body="b"))
     create_content_crud(session, obj_in=ContentPieceCreate(client_id=client2.client_profile.id, title="C2 Read", idea="i", angle="a", content_body="b"))
 
-    token = get_auth_token(client, "admin.content.read@test.com", "pw")
-    response = client.get("/api/v1/contents/", headers={"Authorization": f"Bearer {token}"})
+    response = client.get("/api/v1/contents/", headers=admin_token_headers)
 
     assert response.status_code == 200
     data = response.json()
@@ -213,7 +206,7 @@ def test_mark_as_posted(client: TestClient, session: Session):
     assert data["status"] == ContentStatus.APPROVED or data["status"] == ContentStatus.PUBLISHED
 
 
-def test_rate_content_api(client: TestClient, session: Session):
+def test_rate_content_api(client: TestClient, session: Session, admin_token_headers: Dict[str, str]):
     """
     Test client rating content via API.
     """
@@ -256,14 +249,9 @@ def test_rate_content_api(client: TestClient, session: Session):
     assert response.status_code == 400 # Bad Request from CRUD check
 
     # Test non-client user trying to rate
-    # Provide full_name when creating the admin user directly
-    admin_user = User(email="admin.rate.api@test.com", full_name="Admin Rate API", hashed_password=get_password_hash("pw"), role=UserRole.ADMIN)
-    session.add(admin_user)
-    session.commit()
-    admin_token = get_auth_token(client, "admin.rate.api@test.com", "pw")
     response = client.post(
         f"/api/v1/contents/{content.id}/rate",
-        headers={"Authorization": f"Bearer {admin_token}"},
+        headers=admin_token_headers,
         json=rating_payload
     )
     assert response.status_code == 403 # Forbidden
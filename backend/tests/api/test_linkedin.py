@@ -1,41 +1,100 @@
 """
 Tests for the LinkedIn API endpoints.
 """
+import asyncio
+import json
 import time # Import time
-from unittest.mock import patch, MagicMock
+from functools import lru_cache
+from pathlib import Path
+from unittest.mock import DEFAULT, patch, AsyncMock, MagicMock
 from urllib.parse import urlparse, parse_qs, quote_plus # Keep quote_plus if needed elsewhere, but parse_qs decodes
 from datetime import datetime, timezone, timedelta
+from typing import Callable, Generator
 
+import httpx
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func
 from sqlmodel import Session, select # Import select
-import requests # Import requests for mocking
 
 from app.core.config import settings
 from app.models.user import User, UserCreate # Import UserCreate
-from app.models.scheduled_post import ScheduledLinkedInPost, ScheduledLinkedInPostCreate, PostStatus # Import scheduled post models
-from app.core import oauth_state_manager # To mock its functions
+from app.models.scheduled_post import ScheduledLinkedInPost, ScheduledLinkedInPostCreate, ScheduledLinkedInPostRead, PostStatus # Import scheduled post models
 from app import crud # Import crud for mocking
 from app.core.security import encrypt_data # Import encrypt_data for checking mock call
+from app.core.database import get_session
+from app.main import app, MAX_RETRIES, publish_scheduled_linkedin_posts
+from tests.utils import FakeStateManager
+
+# Fixed offsets, computed once at import. The suite runs well inside the
+# one-hour window.
+_NOW = datetime.now(timezone.utc)
+_FUTURE_TS_1H = _NOW + timedelta(hours=1)
+_FUTURE_TS_2H = _NOW + timedelta(hours=2)
+_FUTURE_TS_1D = _NOW + timedelta(days=1)
+_PAST_TS_1D = _NOW - timedelta(days=1)
+_PAST_TS = _NOW - timedelta(minutes=10)
+
+# Ciphertexts for the fixed test tokens, encrypted once at import
+_ENCRYPTED_TOKENS = {token: encrypt_data(token) for token in ("valid_token", "expired_token")}
 
 # Assuming you have fixtures for TestClient (client) and a test user (normal_user_token_headers)
 # from your conftest.py or similar setup. Also assuming a session fixture.
 
-# Helper to create a mock response for requests.post/get
-def mock_requests_response(status_code: int, json_data: dict | None = None, headers: dict | None = None, raise_for_status: Exception | None = None, text: str | None = None):
-    mock_resp = MagicMock(spec=requests.Response)
-    mock_resp.status_code = status_code
-    mock_resp.headers = headers or {}
-    mock_resp.text = text or ''
-    if json_data is not None:
-        mock_resp.json.return_value = json_data
-    if raise_for_status:
-        mock_resp.raise_for_status.side_effect = raise_for_status
-        # Attach the mock response to the exception if it's an HTTPError
-        if isinstance(raise_for_status, requests.exceptions.HTTPError):
-             raise_for_status.response = mock_resp
-    else:
-        mock_resp.raise_for_status.return_value = None
-    return mock_resp
+class _Resp:
+    """
+    Minimal stand-in for httpx.Response: only the parts the app reads.
+
+    A plain class rather than MagicMock(spec=httpx.Response), which
+    introspects every Response attribute on each construction.
+    """
+    __slots__ = ("status_code", "headers", "text", "_json", "_exc")
+
+    def __init__(self, status_code: int, json_data, headers: dict, text: str, exc: Exception | None):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self._json = json_data
+        self._exc = exc
+
+    def json(self):
+        return self._json
+
+    def raise_for_status(self) -> None:
+        if self._exc:
+            raise self._exc
+
+
+# Helper to create a mock response for the LinkedIn client's post/get
+def mock_http_response(status_code: int, json_data: dict | None = None, headers: dict | None = None, raise_for_status: Exception | None = None, text: str | None = None):
+    return _Resp(status_code, json_data, headers or {}, text or '', raise_for_status)
+
+
+def http_status_error(status_code: int, error_text: str) -> httpx.HTTPStatusError:
+    """The error httpx raises from raise_for_status, with error_text as its message."""
+    request = httpx.Request("POST", "https://api.linkedin.com")
+    return httpx.HTTPStatusError(error_text, request=request, response=httpx.Response(status_code, text=error_text, request=request))
+
+
+# --- Recorded LinkedIn responses ---
+_FIXTURES_DIR = Path(__file__).parent / "fixtures" / "linkedin"
+
+
+@lru_cache(maxsize=None)
+def _read_fixture(name: str) -> dict:
+    return json.loads((_FIXTURES_DIR / f"{name}.json").read_text())
+
+
+def load_fixture(name: str) -> _Resp:
+    """
+    Successful LinkedIn response replayed from fixtures/linkedin/<name>.json.
+
+    Built as a _Resp like every other mocked response.
+    """
+    recorded = _read_fixture(name)
+    body = recorded["json"]
+    return mock_http_response(recorded["status_code"], body, recorded["headers"], text=json.dumps(body))
+
 
 # --- Helper Function to get test user ---
 # This assumes your fixture `normal_user_token_headers` corresponds to a user
@@ -55,53 +114,63 @@ def get_test_user(session: Session) -> User: # Use session fixture name
     return user
 
 # --- Helper Function to set up user with LinkedIn details ---
-def setup_linkedin_user(session: Session, user: User, expired: bool = False): # Use session fixture name
-    expires_at = datetime.now(timezone.utc) + (timedelta(days=-1) if expired else timedelta(days=1))
-    plain_token = "valid_token" if not expired else "expired_token"
+def setup_linkedin_user(session: Session, user: User, **overrides): # Use session fixture name
+    """
+    Give the user a valid LinkedIn connection; keyword overrides replace
+    individual fields (e.g. an expired token or narrower scopes).
+    """
     linkedin_data = {
         "linkedin_id": "test_linkedin_id",
-        "linkedin_access_token": plain_token, # Store plain token temporarily
-        "linkedin_token_expires_at": expires_at,
-        "linkedin_scopes": "openid profile email w_member_social"
+        "linkedin_access_token": "valid_token", # Store plain token temporarily
+        "linkedin_token_expires_at": _FUTURE_TS_1D,
+        "linkedin_scopes": "openid profile email w_member_social",
+        **overrides,
     }
-    # Encrypt token before saving in test setup as well
-    if linkedin_data["linkedin_access_token"]:
-         # Use the actual function here for setup consistency
-         linkedin_data["linkedin_access_token"] = encrypt_data(linkedin_data["linkedin_access_token"])
+    # Encrypt token before saving in test setup as well (the real function,
+    # for setup consistency; the fixed tokens reuse their import-time ciphertext)
+    plain_token = linkedin_data["linkedin_access_token"]
+    if plain_token:
+        linkedin_data["linkedin_access_token"] = _ENCRYPTED_TOKENS.get(plain_token) or encrypt_data(plain_token)
 
+    # update_linkedin_details commits and refreshes the user itself
     crud.user.update_linkedin_details(session=session, db_obj=user, linkedin_data=linkedin_data) # Use session
-    session.refresh(user) # Use session
+
+
+@pytest.fixture
+def linkedin_ready_user(session: Session) -> User:
+    """
+    The test user with a valid (non-expired) LinkedIn connection.
+    """
+    user = get_test_user(session)
+    setup_linkedin_user(session, user)
+    return user
 
 # --- Tests for /connect ---
 def test_initiate_linkedin_connection_success(
-    client: TestClient, normal_user_token_headers: dict[str, str], session: Session # Use session fixture name
+    client: TestClient, normal_user_token_headers: dict[str, str], session: Session, fake_state: FakeStateManager # Use session fixture name
 ) -> None:
     """
     Test successful initiation of LinkedIn connection.
     """
     # Arrange
-    mock_state = "mock_generated_state_string"
     test_user = get_test_user(session) # Use session
     expected_user_id = test_user.id
 
-    with patch("app.core.oauth_state_manager.generate_state", return_value=mock_state), \
-         patch("app.core.oauth_state_manager.store_state") as mock_store_state:
-
-        # Act
-        response = client.get("/api/v1/linkedin/connect", headers=normal_user_token_headers)
+    # Act
+    response = client.get("/api/v1/linkedin/connect", headers=normal_user_token_headers)
 
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "authorization_url" in data
-        auth_url = data["authorization_url"]
-        mock_store_state.assert_called_once_with(mock_state, expected_user_id)
-        parsed_url = urlparse(auth_url)
-        query_params = parse_qs(parsed_url.query)
-        assert query_params.get("client_id") == [settings.LINKEDIN_CLIENT_ID]
-        assert query_params.get("redirect_uri") == [settings.LINKEDIN_REDIRECT_URI]
-        assert query_params.get("state") == [mock_state]
-        assert query_params.get("scope") == ["openid profile email w_member_social"] # Updated scopes
+    # Assert
+    assert response.status_code == 200
+    data = response.json()
+    assert "authorization_url" in data
+    auth_url = data["authorization_url"]
+    parsed_url = urlparse(auth_url)
+    query_params = parse_qs(parsed_url.query)
+    assert query_params.get("client_id") == [settings.LINKEDIN_CLIENT_ID]
+    assert query_params.get("redirect_uri") == [settings.LINKEDIN_REDIRECT_URI]
+    # The state in the URL is the one stored for this user
+    assert fake_state.store == {query_params["state"][0]: expected_user_id}
+    assert query_params.get("scope") == ["openid profile email w_member_social"] # Updated scopes
 
 
 def test_initiate_linkedin_connection_not_configured(
@@ -122,19 +191,37 @@ def test_initiate_linkedin_connection_not_configured(
 
 # --- Tests for /connect/callback ---
 
-@patch("app.core.oauth_state_manager.verify_and_consume_state")
-@patch("requests.post")
-@patch("requests.get")
-@patch("app.crud.user.get")
-@patch("app.crud.user.update_linkedin_details")
+
+@pytest.fixture
+def mock_linkedin_http(monkeypatch) -> MagicMock:
+    """
+    Replace the shared LinkedIn HTTP client with a mock.
+
+    The token exchange (post) and userinfo (get) calls answer successfully
+    by default; tests only override the call they want to fail.
+    """
+    mock_http = MagicMock(spec=httpx.AsyncClient) # post/get become AsyncMocks
+    mock_http.post.return_value = load_fixture("token_ok")
+    mock_http.get.return_value = load_fixture("userinfo_ok")
+    monkeypatch.setattr("app.services.linkedin_http.client", mock_http)
+    return mock_http
+
+
+@pytest.fixture
+def callback_client(shared_test_client: TestClient) -> Generator[TestClient, None, None]:
+    """
+    TestClient for the callback tests, which mock every CRUD call.
+
+    get_session is overridden with a mock, so these tests never open a
+    database connection or pay for the per-test transaction/rollback.
+    """
+    app.dependency_overrides[get_session] = lambda: MagicMock(spec=Session)
+    yield shared_test_client
+    app.dependency_overrides.pop(get_session, None)
+
+
 def test_linkedin_connection_callback_success(
-    mock_update_details: MagicMock,
-    mock_get_user: MagicMock,
-    mock_requests_get: MagicMock,
-    mock_requests_post: MagicMock,
-    mock_verify_state: MagicMock,
-    client: TestClient,
-    session: Session, # Use session fixture name
+    mock_linkedin_http: MagicMock, fake_state: FakeStateManager, callback_client: TestClient
 ) -> None:
     """
     Test successful LinkedIn connection callback.
@@ -142,25 +229,24 @@ def test_linkedin_connection_callback_success(
     test_state = "valid_state_string"
     test_code = "valid_auth_code"
     expected_user_id = 1
-    mock_access_token_plain = "mock_access_token"
-    mock_verify_state.return_value = expected_user_id
+    mock_access_token_plain = load_fixture("token_ok").json()["access_token"]
     mock_user = User(id=expected_user_id, email="test@example.com", full_name="Test User", hashed_password="abc")
-    mock_get_user.return_value = mock_user
-    mock_token_response = mock_requests_response(200, {
-        "access_token": mock_access_token_plain, "expires_in": 3600, "scope": "openid profile email w_member_social" # Updated scopes
-    })
-    mock_requests_post.return_value = mock_token_response
-    mock_profile_response = mock_requests_response(200, {"sub": "mock_linkedin_id"}) # Use 'sub' field
-    mock_requests_get.return_value = mock_profile_response
-
-    response = client.get(f"/api/v1/linkedin/connect/callback?code={test_code}&state={test_state}", follow_redirects=False) # Use follow_redirects
-
-    mock_verify_state.assert_called_once_with(test_state)
-    mock_requests_post.assert_called_once()
-    mock_requests_get.assert_called_once() # Check userinfo call
-    call_args_get, call_kwargs_get = mock_requests_get.call_args
+    fake_state.store[test_state] = expected_user_id
+
+    with patch.multiple("app.crud.user", get=DEFAULT, update_linkedin_details=DEFAULT) as mock_user_crud:
+        mock_http_post, mock_http_get = mock_linkedin_http.post, mock_linkedin_http.get
+        mock_get_user, mock_update_details = mock_user_crud["get"], mock_user_crud["update_linkedin_details"]
+        mock_get_user.return_value = mock_user
+
+        response = callback_client.get(f"/api/v1/linkedin/connect/callback?code={test_code}&state={test_state}", follow_redirects=False) # Use follow_redirects
+
+    assert test_state not in fake_state.store # State was consumed
+    mock_http_post.assert_called_once()
+    mock_http_get.assert_called_once() # Check userinfo call
+    call_args_get, call_kwargs_get = mock_http_get.call_args
     assert call_args_get[0] == "https://api.linkedin.com/v2/userinfo" # Verify userinfo endpoint
-    mock_get_user.assert_called_once_with(session=session, user_id=expected_user_id) # Use session
+    mock_get_user.assert_called_once()
+    assert mock_get_user.call_args.kwargs["user_id"] == expected_user_id
 
     # Check that the mocked update_linkedin_details was called with the correct plain text token
     # (The real function handles encryption)
@@ -176,103 +262,126 @@ def test_linkedin_connection_callback_success(
     assert response.headers["location"] == f"{settings.FRONTEND_URL_BASE}/dashboard/settings?linkedin_status=success" # Use setting
 
 
-@patch("app.core.oauth_state_manager.verify_and_consume_state")
-def test_linkedin_connection_callback_invalid_state(mock_verify_state: MagicMock, client: TestClient) -> None:
-    mock_verify_state.return_value = None
-    response = client.get("/api/v1/linkedin/connect/callback?code=some_code&state=invalid", follow_redirects=False)
-    assert response.status_code == 307
-    # Parse the redirect URL and check the decoded detail parameter
-    redirect_url = urlparse(response.headers["location"])
-    query_params = parse_qs(redirect_url.query)
-    assert query_params.get("linkedin_status") == ["error"]
-    assert query_params.get("detail") == ["Invalid or expired state"]
+def _error_response(status_code: int, error_text: str):
+    """Mock failed LinkedIn response whose raise_for_status raises an HTTPError carrying error_text."""
+    return mock_http_response(status_code, raise_for_status=http_status_error(status_code, error_text), text=error_text)
 
 
-@patch("app.core.oauth_state_manager.verify_and_consume_state", return_value=1)
-@patch("requests.post")
-def test_linkedin_connection_callback_token_exchange_fails(mock_requests_post: MagicMock, mock_verify_state: MagicMock, client: TestClient) -> None:
-    error_message = "Server Error"
-    # Ensure the mock response is attached to the exception
-    http_error = requests.exceptions.HTTPError(error_message)
-    http_error.response = mock_requests_response(500, text=error_message)
-    mock_requests_post.return_value = mock_requests_response(500, raise_for_status=http_error, text=error_message)
+@pytest.fixture
+def callback_mocks(
+    mock_linkedin_http: MagicMock, fake_state: FakeStateManager
+) -> Generator[Callable[[dict], None], None, None]:
+    """
+    Seed the fake state store, patch the user CRUD and drive mock_linkedin_http for the callback.
 
-    response = client.get("/api/v1/linkedin/connect/callback?code=valid_code&state=valid_state", follow_redirects=False)
-    assert response.status_code == 307
-    # Parse the redirect URL and check the decoded detail parameter
-    redirect_url = urlparse(response.headers["location"])
-    query_params = parse_qs(redirect_url.query)
-    assert query_params.get("linkedin_status") == ["error"]
-    # Check the specific error message passed in the redirect
-    assert query_params.get("detail") == [f"Token exchange failed: {error_message}"]
-
-
-@patch("app.core.oauth_state_manager.verify_and_consume_state", return_value=1)
-@patch("requests.post")
-@patch("requests.get")
-def test_linkedin_connection_callback_profile_fetch_fails(mock_requests_get: MagicMock, mock_requests_post: MagicMock, mock_verify_state: MagicMock, client: TestClient) -> None:
-    error_message = "Forbidden"
-    mock_requests_post.return_value = mock_requests_response(200, {"access_token": "mock_access_token", "expires_in": 3600, "scope": "test"})
-    # Ensure the mock response is attached to the exception
-    http_error = requests.exceptions.HTTPError(error_message)
-    http_error.response = mock_requests_response(403, text=error_message)
-    mock_requests_get.return_value = mock_requests_response(403, raise_for_status=http_error, text=error_message)
-
-    response = client.get("/api/v1/linkedin/connect/callback?code=valid_code&state=valid_state", follow_redirects=False)
-    assert response.status_code == 307
-    # Parse the redirect URL and check the decoded detail parameter
-    redirect_url = urlparse(response.headers["location"])
-    query_params = parse_qs(redirect_url.query)
-    assert query_params.get("linkedin_status") == ["error"]
-    # Check the specific error message passed in the redirect
-    assert query_params.get("detail") == [f"Failed to fetch LinkedIn userinfo: {error_message}"]
-
-
-@patch("app.core.oauth_state_manager.verify_and_consume_state", return_value=1)
-@patch("requests.post")
-@patch("requests.get")
-@patch("app.crud.user.get")
-@patch("app.crud.user.update_linkedin_details")
-def test_linkedin_connection_callback_db_update_fails(mock_update_details: MagicMock, mock_get_user: MagicMock, mock_requests_get: MagicMock, mock_requests_post: MagicMock, mock_verify_state: MagicMock, client: TestClient, session: Session) -> None: # Use session fixture name
-    error_message = "Database error"
-    mock_user = User(id=1, email="test@example.com", full_name="Test User", hashed_password="abc")
-    mock_get_user.return_value = mock_user
-    mock_requests_post.return_value = mock_requests_response(200, {"access_token": "mock_access_token", "expires_in": 3600, "scope": "test"})
-    mock_requests_get.return_value = mock_requests_response(200, {"sub": "mock_linkedin_id"}) # Use 'sub'
-    mock_update_details.side_effect = Exception(error_message) # Simulate DB error
-
-    response = client.get("/api/v1/linkedin/connect/callback?code=valid_code&state=valid_state", follow_redirects=False)
+    Yields a function that configures the mocks from a scenario dict; keys
+    left out keep the happy-path defaults, so each scenario only states the
+    step that fails.
+    """
+    with patch.multiple("app.crud.user", get=DEFAULT, update_linkedin_details=DEFAULT) as mock_user_crud:
+        def configure(scenario: dict) -> None:
+            error_text = scenario.get("error_text")
+            user_id = scenario.get("verify_state", 1)
+            if user_id is not None:
+                fake_state.store["valid_state"] = user_id
+            if "post_status" in scenario:
+                mock_linkedin_http.post.return_value = _error_response(scenario["post_status"], error_text)
+            if "get_status" in scenario:
+                mock_linkedin_http.get.return_value = _error_response(scenario["get_status"], error_text)
+            mock_user_crud["get"].return_value = User(id=1, email="test@example.com", full_name="Test User", hashed_password="abc")
+            mock_user_crud["update_linkedin_details"].side_effect = scenario.get("update_side_effect")
+
+        yield configure
+
+
+@pytest.mark.parametrize(
+    "scenario,expected_detail",
+    [
+        pytest.param({"verify_state": None}, "Invalid or expired state", id="invalid_state"),
+        pytest.param(
+            {"post_status": 500, "error_text": "Server Error"},
+            "Token exchange failed: Server Error",
+            id="token_exchange_fails",
+        ),
+        pytest.param(
+            {"get_status": 403, "error_text": "Forbidden"},
+            "Failed to fetch LinkedIn userinfo: Forbidden",
+            id="profile_fetch_fails",
+        ),
+        pytest.param(
+            {"update_side_effect": Exception("Database error")},
+            "Failed to save LinkedIn details: Database error",
+            id="db_update_fails",
+        ),
+    ],
+)
+def test_linkedin_connection_callback_failure(
+    scenario: dict,
+    expected_detail: str,
+    callback_mocks: Callable[[dict], None],
+    callback_client: TestClient,
+) -> None:
+    """Each failing step of the callback redirects to the frontend with its error."""
+    callback_mocks(scenario)
+
+    response = callback_client.get("/api/v1/linkedin/connect/callback?code=valid_code&state=valid_state", follow_redirects=False)
     assert response.status_code == 307
     # Parse the redirect URL and check the decoded detail parameter
     redirect_url = urlparse(response.headers["location"])
     query_params = parse_qs(redirect_url.query)
     assert query_params.get("linkedin_status") == ["error"]
-    # Check the specific error message passed in the redirect
-    assert query_params.get("detail") == [f"Failed to save LinkedIn details: {error_message}"]
+    assert query_params.get("detail") == [expected_detail]
 
 
 # --- Tests for Scheduling Endpoints ---
 
+_FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _FROZEN_NOW (naive when no tz is given)."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW.astimezone(tz) if tz else _FROZEN_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch) -> datetime:
+    """
+    Freeze the LinkedIn endpoints' clock at _FROZEN_NOW and return it.
+
+    Request times can then be built from a known "now", and compared
+    exactly against the response.
+    """
+    monkeypatch.setattr("app.api.endpoints.linkedin.datetime", _FrozenDatetime)
+    return _FROZEN_NOW
+
+
 @patch("app.crud.scheduled_post.create_scheduled_post")
 def test_schedule_linkedin_post_success(
     mock_create: MagicMock,
     client: TestClient,
     normal_user_token_headers: dict[str, str],
-    session: Session # Use session fixture name
+    session: Session, # Use session fixture name
+    linkedin_ready_user: User,
+    frozen_now: datetime,
 ) -> None:
     """Test successfully scheduling a post."""
-    test_user = get_test_user(session) # Use session
-    setup_linkedin_user(session, test_user) # Use session
-    schedule_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    test_user = linkedin_ready_user
+    schedule_time = frozen_now + timedelta(hours=1)
     post_data = {
         "user_id": test_user.id,
         "content_text": "Test post content",
         "scheduled_at": schedule_time.isoformat()
     }
-    mock_create.return_value = ScheduledLinkedInPost(
+    # The table model cannot be built with model_construct (it would have no
+    # ORM state), so the mock returns an unvalidated read schema instead; the
+    # endpoint serializes either one through response_model.
+    mock_create.return_value = ScheduledLinkedInPostRead.model_construct(
         id=1, user_id=test_user.id, content_text=post_data["content_text"],
         scheduled_at=schedule_time, status=PostStatus.PENDING, retry_count=0, # Added retry_count
-        created_at=datetime.now(timezone.utc), updated_at=datetime.now(timezone.utc)
+        created_at=frozen_now, updated_at=frozen_now
     )
 
     response = client.post("/api/v1/linkedin/schedule", headers=normal_user_token_headers, json=post_data)
@@ -283,60 +392,52 @@ def test_schedule_linkedin_post_success(
     assert data["status"] == "pending"
     assert data["user_id"] == test_user.id
     assert data["retry_count"] == 0 # Check retry_count
-    assert data["scheduled_at"].startswith(schedule_time.isoformat().split('+')[0])
+    assert datetime.fromisoformat(data["scheduled_at"]) == schedule_time
     mock_create.assert_called_once()
 
 
-def test_schedule_linkedin_post_token_expired(
-    client: TestClient, normal_user_token_headers: dict[str, str], session: Session # Use session fixture name
-) -> None:
-    """Test scheduling when user's LinkedIn token is expired."""
-    test_user = get_test_user(session) # Use session
-    setup_linkedin_user(session, test_user, expired=True) # Use session
-
-    schedule_time = datetime.now(timezone.utc) + timedelta(hours=1)
-    post_data = {"user_id": test_user.id, "content_text": "Test", "scheduled_at": schedule_time.isoformat()}
-
-    response = client.post("/api/v1/linkedin/schedule", headers=normal_user_token_headers, json=post_data)
-
-    assert response.status_code == 400
-    assert "token expired" in response.json()["detail"]
-
-
-def test_schedule_linkedin_post_missing_scope(
+@pytest.mark.parametrize(
+    "linkedin_overrides,expected_status,expected_detail",
+    [
+        pytest.param(
+            {"linkedin_access_token": "expired_token", "linkedin_token_expires_at": _PAST_TS_1D},
+            400,
+            "token expired",
+            id="token_expired",
+        ),
+        pytest.param(
+            {"linkedin_scopes": "openid profile email"}, # Missing w_member_social
+            403,
+            "Required LinkedIn permission 'w_member_social' not granted",
+            id="missing_scope",
+        ),
+    ],
+)
+def test_schedule_linkedin_post_rejected_connection(
+    linkedin_overrides: dict,
+    expected_status: int,
+    expected_detail: str,
     client: TestClient, normal_user_token_headers: dict[str, str], session: Session # Use session fixture name
 ) -> None:
-    """Test scheduling when user lacks the required 'w_member_social' scope."""
+    """Test scheduling when the user's LinkedIn connection is expired or lacks a scope."""
     test_user = get_test_user(session) # Use session
-    # Setup user with valid token but missing scope
-    linkedin_data = {
-        "linkedin_id": "test_linkedin_id",
-        "linkedin_access_token": "valid_token",
-        "linkedin_token_expires_at": datetime.now(timezone.utc) + timedelta(days=1),
-        "linkedin_scopes": "openid profile email" # Missing w_member_social
-    }
-    # Encrypt token
-    from app.core.security import encrypt_data
-    linkedin_data["linkedin_access_token"] = encrypt_data(linkedin_data["linkedin_access_token"])
-    crud.user.update_linkedin_details(session=session, db_obj=test_user, linkedin_data=linkedin_data) # Use session
-    session.refresh(test_user) # Use session
+    setup_linkedin_user(session, test_user, **linkedin_overrides) # Use session
 
-    schedule_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    schedule_time = _FUTURE_TS_1H
     post_data = {"user_id": test_user.id, "content_text": "Test", "scheduled_at": schedule_time.isoformat()}
 
     response = client.post("/api/v1/linkedin/schedule", headers=normal_user_token_headers, json=post_data)
 
-    assert response.status_code == 403
-    assert "Required LinkedIn permission 'w_member_social' not granted" in response.json()["detail"]
+    assert response.status_code == expected_status
+    assert expected_detail in response.json()["detail"]
 
 
 def test_schedule_linkedin_post_past_time(
-    client: TestClient, normal_user_token_headers: dict[str, str], session: Session # Use session fixture name
+    client: TestClient, normal_user_token_headers: dict[str, str], session: Session, linkedin_ready_user: User # Use session fixture name
 ) -> None:
     """Test scheduling for a time in the past."""
-    test_user = get_test_user(session) # Use session
-    setup_linkedin_user(session, test_user) # Use session
-    schedule_time = datetime.now(timezone.utc) - timedelta(minutes=10) # Time in the past
+    test_user = linkedin_ready_user
+    schedule_time = _PAST_TS # Time in the past
     post_data = {"user_id": test_user.id, "content_text": "Test", "scheduled_at": schedule_time.isoformat()}
 
     response = client.post("/api/v1/linkedin/schedule", headers=normal_user_token_headers, json=post_data)
@@ -350,17 +451,17 @@ def test_list_scheduled_posts(
 ) -> None:
     """Test retrieving scheduled posts for the current user."""
     test_user = get_test_user(session) # Use session
-    # Clean up previous posts for this user to ensure count is correct
-    existing_posts = crud.scheduled_post.get_scheduled_posts_by_user(session, user_id=test_user.id, limit=1000) # Use session
-    for post in existing_posts:
-        session.delete(post) # Use session
-    session.commit() # Use session
+    # No cleanup needed: each test's database changes are rolled back, so
+    # the user starts with no posts
 
     # Create some test posts for this user
-    schedule_time1 = datetime.now(timezone.utc) + timedelta(hours=1)
-    schedule_time2 = datetime.now(timezone.utc) + timedelta(hours=2)
-    crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Post 1", scheduled_at=schedule_time1)) # Use session
-    crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Post 2", scheduled_at=schedule_time2)) # Use session
+    schedule_time1 = _FUTURE_TS_1H
+    schedule_time2 = _FUTURE_TS_2H
+    # One INSERT ... RETURNING and one commit for both posts
+    crud.scheduled_post.create_scheduled_posts(session, objs_in=[ # Use session
+        ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Post 1", scheduled_at=schedule_time1),
+        ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Post 2", scheduled_at=schedule_time2),
+    ])
 
     response = client.get("/api/v1/linkedin/scheduled", headers=normal_user_token_headers)
 
@@ -377,16 +478,18 @@ def test_delete_scheduled_post_success(
 ) -> None:
     """Test successfully deleting a pending scheduled post."""
     test_user = get_test_user(session) # Use session
-    schedule_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    schedule_time = _FUTURE_TS_1H
     post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="To Delete", scheduled_at=schedule_time)) # Use session
     post_id = post.id # Store ID before potential deletion
 
     response = client.delete(f"/api/v1/linkedin/schedule/{post_id}", headers=normal_user_token_headers)
 
     assert response.status_code == 204
-    # Verify post is actually deleted
-    deleted_post = crud.scheduled_post.get_scheduled_post(session, post_id=post_id) # Use session
-    assert deleted_post is None
+    # Verify post is actually deleted (a COUNT, so no row is loaded into the session)
+    remaining = session.scalar(
+        select(func.count()).select_from(ScheduledLinkedInPost).where(ScheduledLinkedInPost.id == post_id)
+    )
+    assert remaining == 0
 
 
 def test_delete_scheduled_post_not_found(
@@ -402,7 +505,7 @@ def test_delete_scheduled_post_not_pending(
 ) -> None:
     """Test deleting a post that is already published or failed."""
     test_user = get_test_user(session) # Use session
-    schedule_time = datetime.now(timezone.utc) + timedelta(hours=1)
+    schedule_time = _FUTURE_TS_1H
     post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Published Post", scheduled_at=schedule_time)) # Use session
     # Manually update status for test
     crud.scheduled_post.update_post_status(session, db_obj=post, status=PostStatus.PUBLISHED, linkedin_post_id="123") # Use session
@@ -415,116 +518,95 @@ def test_delete_scheduled_post_not_pending(
 
 # --- Tests for Scheduler Job (More complex, might need separate setup) ---
 
-@patch("app.core.security.decrypt_data") # Mock decryption for scheduler tests
-@patch("requests.post")
-@patch("app.crud.scheduled_post.update_post_status")
-@patch("app.crud.scheduled_post.update_for_retry")
 def test_scheduler_job_success(
-    mock_update_retry: MagicMock,
-    mock_update_status: MagicMock,
-    mock_requests_post: MagicMock,
-    mock_decrypt: MagicMock, # Add mock decrypt
-    session: Session # Use session fixture name
+    monkeypatch,
+    session: Session, # Use session fixture name
+    linkedin_ready_user: User,
 ):
     """Test the scheduler job successfully publishing a post."""
     # Arrange
-    from app.main import publish_scheduled_linkedin_posts # Import the job function
-    test_user = get_test_user(session) # Use session
-    # Setup user with encrypted token
-    setup_linkedin_user(session, test_user) # Use session
-    # Mock decrypt_data to return the plain token
-    mock_decrypt.return_value = "valid_token"
-
-    schedule_time = datetime.now(timezone.utc) - timedelta(minutes=5) # Due now
-    post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Publish Me", scheduled_at=schedule_time)) # Use session
+    test_user = linkedin_ready_user
+    post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Publish Me", scheduled_at=_PAST_TS)) # Use session
+    post_id = post.id
 
-    mock_requests_post.return_value = mock_requests_response(201, headers={"X-RestLi-Id": "linkedin-post-123"})
+    # Run the job's own sessions on the test connection
+    monkeypatch.setattr("app.main.engine", session.get_bind())
+    mock_post = AsyncMock(return_value=load_fixture("post_created_201"))
+    monkeypatch.setattr("app.services.linkedin_http.client.post", mock_post)
 
     # Act
-    publish_scheduled_linkedin_posts() # Run the job function directly
+    asyncio.run(publish_scheduled_linkedin_posts()) # Run the job function directly
 
     # Assert
-    mock_decrypt.assert_called_once() # Ensure decryption was attempted
-    mock_requests_post.assert_called_once() # Check LinkedIn API was called
-    mock_update_status.assert_called_once() # Check status update was called
-    args, kwargs = mock_update_status.call_args
-    assert kwargs["status"] == PostStatus.PUBLISHED
-    assert kwargs["linkedin_post_id"] == "linkedin-post-123"
-    mock_update_retry.assert_not_called() # Ensure retry logic wasn't triggered
-
-
-@patch("app.core.security.decrypt_data") # Mock decryption for scheduler tests
-@patch("requests.post")
-@patch("app.crud.scheduled_post.update_post_status")
-@patch("app.crud.scheduled_post.update_for_retry")
+    mock_post.assert_called_once() # Check LinkedIn API was called
+    session.expire_all()
+    post = session.get(ScheduledLinkedInPost, post_id)
+    assert post.status == PostStatus.PUBLISHED
+    assert post.linkedin_post_id == "linkedin-post-123"
+
+
+@pytest.mark.parametrize(
+    "initial_retry,expect_final_fail",
+    [(0, False), (MAX_RETRIES - 1, False), (MAX_RETRIES, True)],
+    ids=["first_failure", "next_to_last_retry", "last_retry"],
+)
 def test_scheduler_job_retry_logic(
-    mock_update_retry: MagicMock,
-    mock_update_status: MagicMock,
-    mock_requests_post: MagicMock,
-    mock_decrypt: MagicMock, # Add mock decrypt
-    session: Session # Use session fixture name
+    initial_retry: int,
+    expect_final_fail: bool,
+    monkeypatch,
+    session: Session, # Use session fixture name
+    linkedin_ready_user: User,
 ):
-    """Test the scheduler job retrying on a transient error."""
-    from app.main import publish_scheduled_linkedin_posts, MAX_RETRIES, RETRY_DELAY_MINUTES
-    test_user = get_test_user(session) # Use session
-    setup_linkedin_user(session, test_user) # Use session
-    # Mock decrypt_data to return the plain token
-    mock_decrypt.return_value = "valid_token"
-
-    schedule_time = datetime.now(timezone.utc) - timedelta(minutes=5)
-    post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Retry Me", scheduled_at=schedule_time)) # Use session
+    """Test one scheduler run against a post that has already been retried initial_retry times."""
+    test_user = linkedin_ready_user
+    post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=test_user.id, content_text="Retry Me", scheduled_at=_PAST_TS)) # Use session
+    post.retry_count = initial_retry
+    session.add(post); session.commit() # Use session
+    post_id = post.id
 
+    # The job opens its own sessions on app.main.engine; point it at the
+    # test connection so it sees (and rolls back with) this test's data
+    monkeypatch.setattr("app.main.engine", session.get_bind())
     # Simulate a retryable error (e.g., 500 server error)
     error_message = "Server Error"
-    mock_requests_post.return_value = mock_requests_response(500, raise_for_status=requests.exceptions.HTTPError(error_message), text=error_message)
-
-    # Act - First run (should trigger retry)
-    publish_scheduled_linkedin_posts()
-
-    # Assert - First run
-    mock_decrypt.assert_called_once() # Decryption attempted
-    mock_requests_post.assert_called_once()
-    mock_update_retry.assert_called_once()
-    mock_update_status.assert_not_called()
-    args_retry, kwargs_retry = mock_update_retry.call_args
-    assert kwargs_retry["db_obj"].retry_count == 1
-    assert kwargs_retry["new_scheduled_at"] > schedule_time
-    assert "API Error (Retry 1/3" in kwargs_retry["retry_error_message"]
-
-    # Simulate time passing and run again (still failing)
-    mock_decrypt.reset_mock() # Reset mock for next call count
-    mock_requests_post.reset_mock()
-    mock_update_retry.reset_mock()
-    post.scheduled_at = datetime.now(timezone.utc) - timedelta(minutes=1) # Make it due again
-    session.add(post); session.commit(); session.refresh(post) # Use session
-
-    # Act - Second run
-    publish_scheduled_linkedin_posts()
-
-    # Assert - Second run
-    mock_decrypt.assert_called_once() # Decryption attempted again
-    mock_requests_post.assert_called_once()
-    mock_update_retry.assert_called_once()
-    mock_update_status.assert_not_called()
-    args_retry, kwargs_retry = mock_update_retry.call_args
-    assert kwargs_retry["db_obj"].retry_count == 2
-    assert "API Error (Retry 2/3" in kwargs_retry["retry_error_message"]
-
-    # Simulate time passing and run again (still failing, max retries)
-    mock_decrypt.reset_mock()
-    mock_requests_post.reset_mock()
-    mock_update_retry.reset_mock()
-    post.scheduled_at = datetime.now(timezone.utc) - timedelta(minutes=1)
-    session.add(post); session.commit(); session.refresh(post) # Use session
-
-    # Act - Third run (should hit max retries and fail permanently)
-    publish_scheduled_linkedin_posts()
-
-    # Assert - Third run
-    mock_decrypt.assert_called_once() # Decryption attempted again
-    mock_requests_post.assert_called_once()
-    mock_update_retry.assert_not_called() # Should not retry again
-    mock_update_status.assert_called_once() # Should call update_post_status with FAILED
-    args_status, kwargs_status = mock_update_status.call_args
-    assert kwargs_status["status"] == PostStatus.FAILED
-    assert "API Error: 500" in kwargs_status["error_message"] # Check for specific final error
+    mock_post = AsyncMock(return_value=mock_http_response(500, raise_for_status=http_status_error(500, error_message), text=error_message))
+    monkeypatch.setattr("app.services.linkedin_http.client.post", mock_post)
+
+    # Act - a single run
+    asyncio.run(publish_scheduled_linkedin_posts())
+
+    # Assert
+    session.expire_all()
+    post = session.get(ScheduledLinkedInPost, post_id)
+    mock_post.assert_called_once()
+    if expect_final_fail:
+        assert post.status == PostStatus.FAILED
+        assert post.error_message == f"Failed Post ID {post_id}: {error_message}"
+    else:
+        assert post.status == PostStatus.PENDING
+        assert post.retry_count == initial_retry + 1
+
+
+def test_scheduler_job_fails_exhausted_post_keeping_error(
+    monkeypatch,
+    session: Session, # Use session fixture name
+    linkedin_ready_user: User,
+):
+    """Test that a post already past MAX_RETRIES is failed without another attempt and keeps its last error."""
+    post = crud.scheduled_post.create_scheduled_post(session, obj_in=ScheduledLinkedInPostCreate(user_id=linkedin_ready_user.id, content_text="Exhausted", scheduled_at=_PAST_TS)) # Use session
+    post.retry_count = MAX_RETRIES + 1
+    post.error_message = "Failed Post ID 1: Server Error"
+    session.add(post); session.commit() # Use session
+    post_id = post.id
+
+    monkeypatch.setattr("app.main.engine", session.get_bind())
+    mock_post = AsyncMock()
+    monkeypatch.setattr("app.services.linkedin_http.client.post", mock_post)
+
+    asyncio.run(publish_scheduled_linkedin_posts())
+
+    mock_post.assert_not_called()
+    session.expire_all()
+    post = session.get(ScheduledLinkedInPost, post_id)
+    assert post.status == PostStatus.FAILED
+    assert post.error_message == "Failed Post ID 1: Server Error (max retries exceeded)"
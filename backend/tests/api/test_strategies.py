@@ -10,6 +10,7 @@ from app.crud.strategy import create as create_strategy
 from app.models.client import ClientProfile, ClientProfileCreate # Import ClientProfile
 from app.models.strategy import StrategyCreate
 from app.models.user import User, UserRole
+from tests.utils import token_for
 
 
 # Helper function to create a test client profile and user directly
@@ -48,12 +49,8 @@ def test_create_strategy(client: TestClient, session: Session):
         full_name="Client Strat Create"
     )
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Create strategy
     strategy_data = {
@@ -88,12 +85,8 @@ def test_create_strategy_not_admin(client: TestClient, session: Session):
         full_name="Client Strat Forbidden"
     )
 
-    # Login as client
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "client_strat_forbidden@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for client
+    token = token_for(client_profile.user_id)
 
     # Try to create strategy
     strategy_data = {
@@ -161,12 +154,8 @@ def test_read_strategies(client: TestClient, session: Session):
         ),
     )
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat_read@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Get all strategies
     response = client.get(
@@ -217,12 +206,8 @@ def test_read_strategy(client: TestClient, session: Session):
         ),
     )
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat_read_one@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Get strategy
     response = client.get(
@@ -271,12 +256,8 @@ def test_read_strategy_by_client(client: TestClient, session: Session):
         ),
     )
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat_read_by_client@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Get strategy by client ID
     response = client.get(
@@ -315,12 +296,8 @@ def test_read_my_strategy(client: TestClient, session: Session):
         ),
     )
 
-    # Login as client
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "client_strat_read_me@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for client
+    token = token_for(client_profile.user_id)
 
     # Get own strategy
     response = client.get(
@@ -369,12 +346,8 @@ def test_update_strategy(client: TestClient, session: Session):
         ),
     )
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat_update@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Update strategy
     update_data = {
@@ -430,12 +403,8 @@ def test_delete_strategy(client: TestClient, session: Session):
     )
     strategy_id = strategy.id # Store ID
 
-    # Login as admin
-    login_response = client.post(
-        "/api/v1/auth/token",
-        data={"username": "admin_strat_delete@example.com", "password": "password123"},
-    )
-    token = login_response.json()["access_token"]
+    # Token for admin
+    token = token_for(admin_user.id)
 
     # Delete strategy
     response = client.delete(
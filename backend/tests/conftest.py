@@ -3,40 +3,154 @@ Pytest configuration file.
 
 This file contains fixtures and configuration for pytest.
 """
+import hashlib
 import os
+
+# Minimum bcrypt cost: the suite hashes passwords in nearly every test
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+# The lifespan runs once for the shared TestClient; keep the scheduler out of it
+os.environ.setdefault("SCHEDULER_ENABLED", "false")
+
 import pytest
 from typing import Dict, Generator # Import Dict and Generator
 from fastapi.testclient import TestClient
-from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlmodel import Session, SQLModel, create_engine, select
 from sqlmodel.pool import StaticPool
 
 from app.main import app
+from app.core import security
 from app.core.database import get_session
 from app.models.user import User, UserCreate, UserRole # Import User models
 from app.crud.user import create as create_user # Import user CRUD
 from app.core.security import get_password_hash # Import password hashing
+from tests.utils import FakeStateManager, token_for
 
 
-@pytest.fixture(name="session")
-def session_fixture() -> Generator[Session, None, None]: # Add type hint
+# The schema uses PostgreSQL-only column types; render them as their closest
+# SQLite equivalents so the in-memory test database can be created
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@compiles(CITEXT, "sqlite")
+def _compile_citext_sqlite(type_, compiler, **kw) -> str:
+    return "TEXT COLLATE NOCASE"
+
+
+# The real context, kept for real_password_hashing
+_BCRYPT_CONTEXT = security.pwd_context
+
+
+class _FastHashContext:
     """
-    Create an in-memory SQLite database session for testing.
+    Stand-in for the passlib CryptContext: unsalted SHA-256 instead of bcrypt.
 
-    This fixture creates a new in-memory database for each test,
-    ensuring test isolation.
+    Test hashes are never checked against real stored passwords, so only
+    the hash/verify round-trip matters.
+    """
 
-    Yields:
-        Session: A SQLModel session connected to an in-memory database
+    def hash(self, secret: str) -> str:
+        return "sha256:" + hashlib.sha256(secret.encode()).hexdigest()
+
+    def verify(self, secret: str, hashed: str) -> bool:
+        return hashed == self.hash(secret)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_password_hashing() -> Generator[None, None, None]:
+    """
+    Replace bcrypt with _FastHashContext for the whole test session.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "pwd_context", _FastHashContext())
+        yield
+
+
+@pytest.fixture
+def real_password_hashing(monkeypatch) -> None:
+    """
+    Restore the bcrypt context for tests that check hashing itself.
+    """
+    monkeypatch.setattr(security, "pwd_context", _BCRYPT_CONTEXT)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fake_oauth_state_manager() -> Generator[FakeStateManager, None, None]:
+    """
+    Swap the LinkedIn endpoints' OAuth state manager for a FakeStateManager.
+    """
+    manager = FakeStateManager()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.api.endpoints.linkedin.oauth_state_manager", manager)
+        yield manager
+
+
+@pytest.fixture(name="fake_state")
+def fake_state_fixture(fake_oauth_state_manager: FakeStateManager) -> FakeStateManager:
+    """
+    The session's FakeStateManager, emptied for this test.
+    """
+    fake_oauth_state_manager.store.clear()
+    return fake_oauth_state_manager
+
+
+@pytest.fixture(name="default_hashed_password", scope="session")
+def default_hashed_password_fixture() -> str:
+    """
+    Hash of "password123", computed once for the whole test session.
+
+    Tests that insert User rows directly reuse it instead of hashing
+    the same password again in every test.
+    """
+    return get_password_hash("password123")
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture():
+    """
+    Create one in-memory SQLite database, with the schema, for the whole test session.
+
+    pysqlite's own transaction handling is switched off so SQLAlchemy emits
+    BEGIN itself; otherwise SAVEPOINTs inside a test do not work.
     """
-    # Create an in-memory SQLite database for testing
     engine = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
+    return engine
+
 
-    with Session(engine) as session:
+@pytest.fixture(name="session")
+def session_fixture(engine) -> Generator[Session, None, None]: # Add type hint
+    """
+    Create a database session for testing, rolled back after the test.
+
+    The session runs inside an outer transaction on the shared engine; its
+    commits only release SAVEPOINTs, so rolling back the outer transaction
+    at teardown leaves the database empty for the next test.
+
+    Yields:
+        Session: A SQLModel session connected to the in-memory database
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         # Override the get_session dependency
         def get_session_override():
             yield session
@@ -47,21 +161,81 @@ def session_fixture() -> Generator[Session, None, None]: # Add type hint
 
     # Remove the override after the test
     app.dependency_overrides.clear()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="shared_test_client", scope="session")
+def shared_test_client_fixture() -> Generator[TestClient, None, None]:
+    """
+    Create the FastAPI TestClient once for the whole test session.
+
+    The app keeps no state between tests (the database lives in the
+    function-scoped session fixture), so one client can serve every test.
+    It is entered as a context manager, so the app lifespan runs once and
+    the client's transport stays open until the session ends.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session) -> TestClient: # Add session dependency
+def client_fixture(session: Session, shared_test_client: TestClient) -> TestClient: # Add session dependency
     """
-    Create a FastAPI TestClient configured with the test session.
+    Return the shared FastAPI TestClient, configured with the test session.
 
     Args:
         session: The test database session fixture.
+        shared_test_client: The session-scoped TestClient.
 
     Returns:
         TestClient: A FastAPI test client.
     """
     # The session fixture already handles dependency override
-    yield TestClient(app)
+    return shared_test_client
+
+
+@pytest.fixture(name="admin_token")
+def admin_token_fixture(session: Session, default_hashed_password: str) -> str:
+    """
+    Create an admin user and return a bearer token for it.
+
+    The token is minted directly, so no /auth/token round-trip (and no
+    bcrypt verify) is needed; test_auth covers the login flow itself.
+    """
+    admin_user = User(
+        email="admin_token@example.com",
+        hashed_password=default_hashed_password,
+        full_name="Admin User",
+        role=UserRole.ADMIN,
+    )
+    session.add(admin_user)
+    session.commit()
+    return token_for(admin_user.id)
+
+
+@pytest.fixture(name="admin_token_headers")
+def admin_token_headers_fixture(admin_token: str) -> Dict[str, str]:
+    """
+    Authorization headers for the admin_token user.
+    """
+    return {"Authorization": f"Bearer {admin_token}"}
+
+
+@pytest.fixture(name="client_token")
+def client_token_fixture(session: Session, default_hashed_password: str) -> str:
+    """
+    Create a client-role user (without a profile) and return a bearer token for it.
+    """
+    client_user = User(
+        email="client_token@example.com",
+        hashed_password=default_hashed_password,
+        full_name="Client User",
+        role=UserRole.CLIENT,
+    )
+    session.add(client_user)
+    session.commit()
+    return token_for(client_user.id)
 
 
 @pytest.fixture(name="normal_user_token_headers")
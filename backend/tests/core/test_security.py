@@ -2,6 +2,7 @@
 Tests for security utilities.
 """
 from datetime import timedelta, datetime, timezone # Import timezone
+import pytest
 from jose import jwt
 
 from app.core.config import settings
@@ -14,6 +15,7 @@ from app.core.security import (
 )
 
 
+@pytest.mark.usefixtures("real_password_hashing")
 def test_password_hashing():
     """
     Test password hashing and verification.
@@ -7,6 +7,7 @@ from fastapi import HTTPException
 
 from app.crud.client import (
     create,
+    create_many,
     delete,
     get,
     get_by_user_id,
@@ -79,6 +80,34 @@ def test_create_client_duplicate_email(session: Session):
     assert "email already exists" in excinfo.value.detail.lower()
 
 
+def test_create_many_clients(session: Session):
+    """
+    Test creating several clients and their users in one call.
+    """
+    objs_in = [
+        ClientProfileCreate(
+            email=f"many{i}.crud@example.com",
+            password="password123",
+            company_name=f"Many Co {i}",
+            industry="Testing",
+        )
+        for i in range(3)
+    ]
+    client_profiles = create_many(session, objs_in=objs_in)
+
+    assert [c.company_name for c in client_profiles] == [o.company_name for o in objs_in]
+    for client_profile, client_in in zip(client_profiles, objs_in):
+        user = get_user(session, client_profile.user_id)
+        assert user.email == client_in.email
+        assert user.full_name == client_in.company_name # Falls back to company name
+        assert user.role == UserRole.CLIENT
+
+    # Any taken email rejects the whole batch
+    with pytest.raises(HTTPException) as excinfo:
+        create_many(session, objs_in=[objs_in[0]])
+    assert excinfo.value.status_code == 400
+
+
 # Removed test_create_client_invalid_user_role as it's no longer applicable
 
 
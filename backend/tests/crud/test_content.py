@@ -1,6 +1,8 @@
 """
 Tests for content CRUD operations.
 """
+import asyncio
+import httpx
 import pytest
 from sqlmodel import Session, select # Import select
 from pydantic import ValidationError # Import Pydantic ValidationError
@@ -19,6 +21,7 @@ from app.crud.content import (
     ContentRatingInput
 )
 from app.crud.client import create as create_client_crud
+from app.core.security import encrypt_data
 from app.models.client import ClientProfile, ClientProfileCreate
 from app.models.content import ContentPiece, ContentPieceCreate, ContentPieceUpdate, ContentStatus
 from app.models.user import User, UserRole # Import User for rating test
@@ -283,3 +286,56 @@ def test_rate_content(session: Session):
     with pytest.raises(HTTPException) as excinfo_perm:
         rate_content(session, content_id=content.id, rating_in=rating_in, client_user=other_client_user)
     assert excinfo_perm.value.status_code == 403 # Forbidden
+
+
+def test_update_content_uploads_attachments_to_linkedin(session: Session, tmp_path, monkeypatch):
+    """
+    Test that scheduling content with attachments uploads them through the LinkedIn service.
+    """
+    png_bytes = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+    image_path = tmp_path / "image.png"
+    image_path.write_bytes(png_bytes)
+
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        if request.method == "POST":
+            return httpx.Response(200, json={
+                "value": {
+                    "uploadMechanism": {
+                        "com.linkedin.digitalmedia.uploading.MediaUploadHttpRequest": {
+                            "uploadUrl": "https://upload.linkedin.test/image"
+                        }
+                    },
+                    "asset": "asset-123",
+                }
+            })
+        return httpx.Response(201)
+
+    monkeypatch.setattr(
+        "app.services.linkedin_http.client",
+        httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    client = create_test_client(session, email="client.upload@test.com", company="Upload Co")
+    user = client.user
+    user.linkedin_id = "li-upload-user"
+    user.linkedin_access_token = encrypt_data("upload-token")
+    content = create(session, obj_in=ContentPieceCreate(client_id=client.id, title="Upload Me", idea="i", angle="a", content_body="b"))
+    content.attachments = [str(image_path)]
+
+    updated_content = asyncio.run(update(
+        session,
+        db_obj=content,
+        obj_in=ContentPieceUpdate(status=ContentStatus.SCHEDULED),
+        user=user,
+    ))
+
+    assert updated_content.linkedin_media_assets == ["urn:li:digitalmediaAsset:asset-123"]
+    register_request, upload_request = requests_seen
+    assert register_request.headers["Authorization"] == "Bearer upload-token"
+    assert upload_request.method == "PUT"
+    assert str(upload_request.url) == "https://upload.linkedin.test/image"
+    assert upload_request.headers["Content-Type"] == "image/png"
+    assert upload_request.read() == png_bytes
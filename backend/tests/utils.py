@@ -0,0 +1,45 @@
+"""
+Shared helpers for tests.
+"""
+from functools import lru_cache
+from typing import Dict, Optional
+
+from app.core.security import create_access_token
+
+
+@lru_cache(maxsize=64)
+def token_for(user_id: int) -> str:
+    """
+    Return a bearer token for the given user ID, minted once per ID.
+
+    The token only carries the user ID (and a far-off expiry), so it stays
+    valid for whichever user holds that ID in the current test's database.
+    Tests use it instead of logging in through /auth/token; test_auth
+    covers the login flow itself.
+    """
+    return create_access_token(user_id)
+
+
+class FakeStateManager:
+    """
+    In-memory stand-in for app.core.oauth_state_manager, without expiry.
+
+    Tests seed or inspect ``store`` (state -> user_id) directly instead of
+    patching the module's functions.
+    """
+
+    def __init__(self) -> None:
+        self.store: Dict[str, int] = {}
+
+    def generate_state(self) -> str:
+        return f"s_{len(self.store)}"
+
+    def store_state(self, state: str, user_id: int) -> None:
+        self.store[state] = user_id
+
+    def verify_and_consume_state(self, received_state: str) -> Optional[int]:
+        return self.store.pop(received_state, None)
+
+    def clear_user_states(self, user_id: int) -> None:
+        for state in [state for state, uid in self.store.items() if uid == user_id]:
+            del self.store[state]